@@ -1,6 +1,8 @@
 #   Created by Elshad Karimov 
 #   Copyright © 2021 AppMillers. All rights reserved.
 
+from collections import deque
+import numpy as np
 
 class Graph:
 
@@ -25,9 +27,14 @@ class Graph:
         dist[src] = 0
 
         for _ in range(self.V-1):
+            changed = False
             for s, d, w in self.graph:
                 if dist[s] != float("Inf") and dist[s] + w < dist[d]:
                     dist[d] = dist[s] + w
+                    changed = True
+            # a pass without changes means every distance is final
+            if not changed:
+                break
         
         for s, d, w in self.graph:
             if dist[s] != float("Inf") and dist[s] + w < dist[d]:
@@ -37,6 +44,84 @@ class Graph:
 
         self.print_solution(dist)
 
+    # same distances, but the edges are stored as three columns and each round relaxes all of them at once:
+    # candidate = dist[sources] + weights, then a scatter-minimum of candidate into dist at targets
+    def bellmanFordNumpy(self, src):
+        index = {node : i for i, node in enumerate(self.nodes)}
+        sources = np.array([index[s] for s, d, w in self.graph], dtype=np.intp)
+        targets = np.array([index[d] for s, d, w in self.graph], dtype=np.intp)
+        isInt = all(isinstance(w, int) for s, d, w in self.graph)
+        weights = np.array([w for s, d, w in self.graph], dtype=np.int64 if isInt else np.float64)
+        weights = weights.astype(np.float64)
+        dist = np.full(len(self.nodes), np.inf)
+        dist[index[src]] = 0
+
+        for _ in range(self.V):
+            relaxed = dist.copy()
+            np.minimum.at(relaxed, targets, dist[sources] + weights)
+            # a round without changes means every distance is final
+            if np.array_equal(relaxed, dist):
+                break
+            dist = relaxed
+        else:
+            print("Graph contains negative cycle")
+            return
+
+        # hand back the same types bellmanFord prints: int distances for int weights, the source as int 0
+        toPython = int if isInt else float
+        dist = {node : toPython(dist[i]) if dist[i] != np.inf else float("Inf") for node, i in index.items()}
+        dist[src] = 0
+        self.print_solution(dist)
+
+    # queue-based Bellman-Ford (SPFA)
+    # only edges out of vertices whose distance changed are relaxed again; stops when the queue is empty
+    # src=None starts every vertex at 0, which finds a negative cycle anywhere (arbitrage detection)
+    # returns (dist, cycle) - cycle is a negative cycle in edge order, or [] if there is none
+    def bellmanFordQueue(self, src=None):
+        adjacency = {i : [] for i in self.nodes}
+        for s, d, w in self.graph:
+            adjacency[s].append((d, w))
+
+        sources = list(self.nodes) if src is None else [src]
+        dist = {i : float("Inf") for i in self.nodes}
+        parent = {i : None for i in self.nodes}
+        edges = {i : 0 for i in self.nodes}
+        for i in sources:
+            dist[i] = 0
+        queue = deque(sources)
+        inQueue = set(sources)
+
+        while queue:
+            s = queue.popleft()
+            inQueue.discard(s)
+            for d, w in adjacency[s]:
+                if dist[s] + w < dist[d]:
+                    dist[d] = dist[s] + w
+                    parent[d] = s
+                    edges[d] = edges[s] + 1
+                    # a shortest path with V edges repeats a vertex, so it runs through a negative cycle
+                    if edges[d] >= self.V:
+                        cycle = self.findCycle(parent, d)
+                        if cycle:
+                            return dist, cycle
+                    if d not in inQueue:
+                        inQueue.add(d)
+                        queue.append(d)
+
+        return dist, []
+
+    # follow parent links from node until a vertex repeats
+    def findCycle(self, parent, node):
+        position = {}
+        chain = []
+        while node is not None and node not in position:
+            position[node] = len(chain)
+            chain.append(node)
+            node = parent[node]
+        if node is None:
+            return []
+        return chain[position[node]:][::-1]
+
 g = Graph(5)
 g.addNode("A")
 g.addNode("B")
@@ -57,3 +142,16 @@ g.bellmanFord("E")
         
 
   
+g.bellmanFordNumpy("E")
+dist, cycle = g.bellmanFordQueue("E")
+g.print_solution(dist)
+
+# currency exchange rates as -log(rate): a negative cycle is an arbitrage opportunity
+a = Graph(3)
+a.addNode("USD")
+a.addNode("EUR")
+a.addNode("GBP")
+a.add_edge("USD", "EUR", -0.1)
+a.add_edge("EUR", "GBP", -0.2)
+a.add_edge("GBP", "USD", 0.25)
+print(a.bellmanFordQueue()[1])
@@ -1,4 +1,6 @@
 import heapq
+import pickle
+from IndexedHeap import IndexedMinHeap
 # class for edges
 
 class Edge:
@@ -15,6 +17,8 @@ class Node:
         # previous node that we come to this node
         self.predecessor = None
         self.neighbors = []
+        # edges pointing into this node, used by the reverse search of point_to_point
+        self.incoming = []
         self.min_distance = float("inf")
     
     def __lt__(self, other_node):
@@ -23,13 +27,21 @@ class Node:
     def add_edge(self, weight, destination_vertex):
         edge = Edge(weight, self, destination_vertex)
         self.neighbors.append(edge)
+        destination_vertex.incoming.append(edge)
 
 # Dijkstra Algorithm
+# mode="lazy" pushes a vertex again every time its distance improves (heap can grow to O(E))
+# mode="indexed" keeps each vertex in the heap once and lowers its key in place (heap stays O(V))
 class Dijkstra:
-    def __init__(self):
-        self.heap = []
+    def __init__(self, mode="lazy", arity=2):
+        if mode not in ("lazy", "indexed"):
+            raise ValueError("mode must be 'lazy' or 'indexed'")
+        self.mode = mode
+        self.heap = IndexedMinHeap(arity) if mode == "indexed" else []
     
     def calculate(self, start_vertex):
+        if self.mode == "indexed":
+            return self.calculate_indexed(start_vertex)
         start_vertex.min_distance = 0
         heapq.heappush(self.heap, start_vertex)
         
@@ -51,6 +63,108 @@ class Dijkstra:
                     # [F-19, F-17]
             actual_vertex.visited = True
     
+    def calculate_indexed(self, start_vertex):
+        start_vertex.min_distance = 0
+        self.heap.push(start_vertex, 0)
+
+        while self.heap:
+            # every vertex is popped exactly once, so no stale entries to skip
+            actual_vertex, _ = self.heap.pop()
+            actual_vertex.visited = True
+            for edge in actual_vertex.neighbors:
+                target = edge.target_vertex
+                if target.visited:
+                    continue
+                new_distance = actual_vertex.min_distance + edge.weight
+                if new_distance < target.min_distance:
+                    target.min_distance = new_distance
+                    target.predecessor = actual_vertex
+                    # insert or decrease-key
+                    self.heap.push_or_decrease(target, new_distance)
+    
+    # bidirectional search: grow a forward tree from source and a reverse tree from target
+    # and stop once the two frontiers cannot produce a shorter path than the best meeting point
+    # node state (min_distance, visited, predecessor) is left untouched
+    def point_to_point(self, source, target):
+        if source is target:
+            return 0, [source.name]
+        distances = ({source: 0}, {target: 0})
+        parents = ({source: None}, {target: None})
+        settled = (set(), set())
+        heaps = (IndexedMinHeap(), IndexedMinHeap())
+        heaps[0].push(source, 0)
+        heaps[1].push(target, 0)
+        best = float("inf")
+        meeting = None
+
+        while heaps[0] and heaps[1]:
+            forwardMin = heaps[0].peek()[1]
+            backwardMin = heaps[1].peek()[1]
+            if forwardMin + backwardMin >= best:
+                break
+            # expand the side whose frontier is closer
+            side = 0 if forwardMin <= backwardMin else 1
+            actual_vertex, distance = heaps[side].pop()
+            settled[side].add(actual_vertex)
+            edges = actual_vertex.neighbors if side == 0 else actual_vertex.incoming
+            for edge in edges:
+                next_vertex = edge.target_vertex if side == 0 else edge.start_vertex
+                if next_vertex in settled[side]:
+                    continue
+                new_distance = distance + edge.weight
+                if new_distance < distances[side].get(next_vertex, float("inf")):
+                    distances[side][next_vertex] = new_distance
+                    parents[side][next_vertex] = actual_vertex
+                    heaps[side].push_or_decrease(next_vertex, new_distance)
+                other = distances[1 - side].get(next_vertex)
+                if other is not None and distances[side][next_vertex] + other < best:
+                    best = distances[side][next_vertex] + other
+                    meeting = next_vertex
+
+        if meeting is None:
+            return float("inf"), []
+        path = []
+        actual_vertex = meeting
+        while actual_vertex is not None:
+            path.append(actual_vertex.name)
+            actual_vertex = parents[0][actual_vertex]
+        path.reverse()
+        actual_vertex = parents[1][meeting]
+        while actual_vertex is not None:
+            path.append(actual_vertex.name)
+            actual_vertex = parents[1][actual_vertex]
+        return best, path
+
+    # A* search: like Dijkstra but the heap is ordered by distance + heuristic(vertex, target)
+    # heuristic must never overestimate the remaining distance (admissible)
+    # a vertex whose distance improves after it was popped is pushed again, so consistency is not required
+    def astar(self, source, target, heuristic):
+        distances = {source: 0}
+        parents = {source: None}
+        heap = IndexedMinHeap()
+        heap.push(source, heuristic(source, target))
+
+        while heap:
+            actual_vertex, _ = heap.pop()
+            if actual_vertex is target:
+                path = []
+                while actual_vertex is not None:
+                    path.append(actual_vertex.name)
+                    actual_vertex = parents[actual_vertex]
+                return distances[target], path[::-1]
+            for edge in actual_vertex.neighbors:
+                next_vertex = edge.target_vertex
+                new_distance = distances[actual_vertex] + edge.weight
+                if new_distance < distances.get(next_vertex, float("inf")):
+                    estimate = heuristic(next_vertex, target)
+                    if estimate == float("inf"):
+                        # the heuristic proved target is unreachable from here
+                        continue
+                    distances[next_vertex] = new_distance
+                    parents[next_vertex] = actual_vertex
+                    heap.push_or_decrease(next_vertex, new_distance + estimate)
+        return float("inf"), []
+
     def get_shortest_path(self, vertex):
         print(f"The shortest path to the vertext is: {vertex.min_distance}")
         actual_vertex = vertex
@@ -60,6 +174,85 @@ class Dijkstra:
 
 
 
+# distances from source to every reachable node, keyed by node name
+# reverse=True follows incoming edges, giving distances from every node to source
+def shortestDistances(source, reverse=False):
+    distances = {source: 0}
+    heap = IndexedMinHeap()
+    heap.push(source, 0)
+    while heap:
+        actual_vertex, distance = heap.pop()
+        edges = actual_vertex.incoming if reverse else actual_vertex.neighbors
+        for edge in edges:
+            next_vertex = edge.start_vertex if reverse else edge.target_vertex
+            new_distance = distance + edge.weight
+            if new_distance < distances.get(next_vertex, float("inf")):
+                distances[next_vertex] = new_distance
+                heap.push_or_decrease(next_vertex, new_distance)
+    return {vertex.name: distance for vertex, distance in distances.items()}
+
+
+# ALT (A*, Landmarks, Triangle inequality)
+# for a landmark L the triangle inequality gives two lower bounds on dist(v, t):
+#   dist(L, t) - dist(L, v)  and  dist(v, L) - dist(t, L)
+# the heuristic is the largest bound over all landmarks
+# tables are keyed by node name so they can be saved once and loaded by another process
+class Landmarks:
+    def __init__(self, names, fromLandmark, toLandmark):
+        self.names = names
+        self.fromLandmark = fromLandmark
+        self.toLandmark = toLandmark
+
+    # nodes: every node of the graph
+    # landmarks: nodes to use, otherwise `count` nodes are picked far apart from each other
+    @classmethod
+    def build(cls, nodes, count=4, landmarks=None):
+        if landmarks is None:
+            landmarks = []
+            closest = {node: float("inf") for node in nodes}
+            candidate = nodes[0]
+            while len(landmarks) < min(count, len(nodes)):
+                landmarks.append(candidate)
+                distances = shortestDistances(candidate)
+                for node in nodes:
+                    closest[node] = min(closest[node], distances.get(node.name, float("inf")))
+                    if node in landmarks:
+                        closest[node] = -1
+                # next landmark: the node farthest from every landmark chosen so far
+                candidate = max(nodes, key=lambda node: closest[node])
+        names = [landmark.name for landmark in landmarks]
+        fromLandmark = [shortestDistances(landmark) for landmark in landmarks]
+        toLandmark = [shortestDistances(landmark, reverse=True) for landmark in landmarks]
+        return cls(names, fromLandmark, toLandmark)
+
+    def heuristic(self, vertex, target):
+        inf = float("inf")
+        bound = 0
+        for fromL, toL in zip(self.fromLandmark, self.toLandmark):
+            lv, lt = fromL.get(vertex.name, inf), fromL.get(target.name, inf)
+            if lv != inf:
+                # L reaches vertex but not target, so vertex cannot reach target either
+                if lt == inf:
+                    return inf
+                bound = max(bound, lt - lv)
+            vl, tl = toL.get(vertex.name, inf), toL.get(target.name, inf)
+            if tl != inf:
+                if vl == inf:
+                    return inf
+                bound = max(bound, vl - tl)
+        return bound
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            pickle.dump({"names": self.names, "from": self.fromLandmark, "to": self.toLandmark}, file)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            table = pickle.load(file)
+        return cls(table["names"], table["from"], table["to"])
+
+
 # Step 1 - create nodes
 nodeA = Node("A")
 nodeB = Node("B")
@@ -97,6 +290,11 @@ nodeH.add_edge(14, nodeG)
 algorithm = Dijkstra()
 algorithm.calculate(nodeA)
 algorithm.get_shortest_path(nodeG)
+print()
+print(Dijkstra().point_to_point(nodeA, nodeG))
+
+landmarks = Landmarks.build([nodeA, nodeB, nodeC, nodeD, nodeE, nodeF, nodeG, nodeH], count=2)
+print(Dijkstra().astar(nodeA, nodeG, landmarks.heuristic))
 
 
 
@@ -2,6 +2,7 @@
 #   Copyright © 2021 AppMillers. All rights reserved.
 
 from collections import defaultdict
+from IndexedHeap import IndexedMinHeap
 
 class Graph:
     def __init__(self):
@@ -17,34 +18,42 @@ class Graph:
         self.distances[(fromNode, toNode)] = distance
 
 
+# heap-driven Dijkstra
+# visited: node -> shortest distance from initial
+# path: node -> its single predecessor on the shortest path (None for initial)
 def dijkstra(graph, initial):
     visited = {initial : 0}
-    path = defaultdict(list)
+    path = {initial : None}
+    settled = set()
 
-    nodes = set(graph.nodes)
+    heap = IndexedMinHeap()
+    heap.push(initial, 0)
 
-    while nodes:
-        minNode = None
-        for node in nodes:
-            if node in visited:
-                if minNode is None:
-                    minNode = node
-                elif visited[node] < visited[minNode]:
-                    minNode = node
-        if minNode is None:
-            break
-
-        nodes.remove(minNode)
-        currentWeight = visited[minNode]
+    while heap:
+        minNode, currentWeight = heap.pop()
+        settled.add(minNode)
 
         for edge in graph.edges[minNode]:
+            if edge in settled:
+                continue
             weight = currentWeight + graph.distances[(minNode, edge)]
             if edge not in visited or weight < visited[edge]:
                 visited[edge] = weight
-                path[edge].append(minNode)
+                path[edge] = minNode
+                heap.push_or_decrease(edge, weight)
     
     return visited, path
 
+# rebuild the route to target only when it is asked for
+def getPath(path, target):
+    if target not in path:
+        return []
+    route = []
+    while target is not None:
+        route.append(target)
+        target = path[target]
+    return route[::-1]
+
 customGraph = Graph()
 customGraph.addNode("A")
 customGraph.addNode("B")
@@ -63,6 +72,8 @@ customGraph.addEdge("D", "E", 4)
 customGraph.addEdge("E", "G", 9)
 customGraph.addEdge("F", "G", 7)
 
-print(dijkstra(customGraph, "A"))
+distances, path = dijkstra(customGraph, "A")
+print(distances)
+print(getPath(path, "G"))
 
 
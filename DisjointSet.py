@@ -3,34 +3,81 @@
 
 # Disjoint Set in Python
 
+from array import array
+
+# Array-backed Disjoint Set over the integers 0..n-1
+# parent and size are int32 arrays, find is iterative with path halving
+# and union attaches the smaller tree under the larger one (union by size)
+class ArrayDisjointSet:
+    def __init__(self, n):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+        # number of disjoint sets
+        self.count = n
+
+    def __len__(self):
+        return len(self.parent)
+
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            # path halving: point x at its grandparent and jump there
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    # returns True when x and y were in different sets
+    def union(self, x, y):
+        xroot = self.find(x)
+        yroot = self.find(y)
+        if xroot == yroot:
+            return False
+        if self.size[xroot] < self.size[yroot]:
+            xroot, yroot = yroot, xroot
+        self.parent[yroot] = xroot
+        self.size[xroot] += self.size[yroot]
+        self.count -= 1
+        return True
+
+    def connected(self, x, y):
+        return self.find(x) == self.find(y)
+
+    # batched find over any sequence of ids, returns an int32 array of roots
+    def find_many(self, items):
+        find = self.find
+        return array('i', [find(x) for x in items])
+
+    # batched union over parallel sequences xs, ys (e.g. the two columns of an edge array)
+    # returns a bytearray with 1 where the pair merged two sets
+    def union_many(self, xs, ys):
+        union = self.union
+        return bytearray(union(x, y) for x, y in zip(xs, ys))
+
+
+# Label layer: keeps the original API for arbitrary hashable vertices (e.g. "A", "B")
+# every vertex gets an integer id once; find returns the label of the root
 class DisjointSet:
     def __init__(self, vertices):
-        self.vertices = vertices
-        self.parent = {}
-        for v in vertices:
-            self.parent[v] = v
-        self.rank = dict.fromkeys(vertices, 0)
-    
+        self.vertices = list(vertices)
+        self.index = {v : i for i, v in enumerate(self.vertices)}
+        self.sets = ArrayDisjointSet(len(self.vertices))
+
+    @property
+    def count(self):
+        return self.sets.count
+
     def find(self, item):
-        if self.parent[item] == item:
-            return item
-        else:
-            return self.find(self.parent[item])
-    
+        return self.vertices[self.sets.find(self.index[item])]
+
     def union(self, x, y):
-        xroot = self.find(x)
-        yroot = self.find(y)
-        if self.rank[xroot] < self.rank[yroot]:
-            self.parent[xroot] = yroot
-        elif self.rank[xroot] > self.rank[yroot]:
-            self.parent[yroot] = xroot
-        else:
-            self.parent[yroot] = xroot
-            self.rank[xroot] += 1
+        return self.sets.union(self.index[x], self.index[y])
+
+    def connected(self, x, y):
+        return self.sets.connected(self.index[x], self.index[y])
 
 # vertices = ["A", "B", "C", "D", "E"]
 
 # ds = DisjointSet(vertices)
 # ds.union("A", "B")
 # ds.union("A", "C")
-# print(ds.find("A"))
\ No newline at end of file
+# print(ds.find("A"))
@@ -2,6 +2,7 @@
 #   Copyright © 2021 AppMillers. All rights reserved.
 
 # Floyd Warshall Algorithm in python
+import numpy as np
 
 INF = 9999
 # Printing the solution
@@ -24,6 +25,15 @@ def floydWarshall(nV, G):
     
     printSolution(nV, distance)
 
+# same result, but each k step updates the whole matrix at once:
+# distance[i][j] = min(distance[i][j], distance[i][k] + distance[k][j]) for every i, j
+def floydWarshallNumpy(nV, G):
+    distance = np.array(G)
+    for k in range(nV):
+        np.minimum(distance, distance[:, k, None] + distance[None, k, :], out=distance)
+
+    printSolution(nV, distance)
+
 G = [[0, 8, INF,1],
     [INF, 0, 1,INF],
     [4, INF, 0,INF],
@@ -32,3 +42,4 @@ G = [[0, 8, INF,1],
 
 floydWarshall(4, G)
 
+floydWarshallNumpy(4, G)
@@ -0,0 +1,115 @@
+# Indexed d-ary Min Heap in Python
+# Every key sits in the heap at most once and its position is tracked,
+# so a priority can be lowered in place (decrease-key) instead of pushing a duplicate.
+
+class IndexedMinHeap:
+    def __init__(self, arity=2):
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self.arity = arity
+        self.keys = []
+        self.priorities = []
+        # key -> index of the key inside self.keys
+        self.position = {}
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self.position
+
+    def peek(self):
+        if not self.keys:
+            raise IndexError("peek from an empty heap")
+        return self.keys[0], self.priorities[0]
+
+    def priority(self, key):
+        return self.priorities[self.position[key]]
+
+    def push(self, key, priority):
+        if key in self.position:
+            raise KeyError(f"{key!r} is already in the heap")
+        self.keys.append(key)
+        self.priorities.append(priority)
+        self.position[key] = len(self.keys) - 1
+        self.siftUp(len(self.keys) - 1)
+
+    def decrease_key(self, key, priority):
+        index = self.position[key]
+        if priority > self.priorities[index]:
+            raise ValueError("new priority is greater than the current priority")
+        self.priorities[index] = priority
+        self.siftUp(index)
+
+    # insert the key, or lower its priority if it is already queued
+    # returns False when the key is queued with a priority that is already as good
+    def push_or_decrease(self, key, priority):
+        index = self.position.get(key)
+        if index is None:
+            self.push(key, priority)
+            return True
+        if priority < self.priorities[index]:
+            self.priorities[index] = priority
+            self.siftUp(index)
+            return True
+        return False
+
+    def pop(self):
+        if not self.keys:
+            raise IndexError("pop from an empty heap")
+        key, priority = self.keys[0], self.priorities[0]
+        lastKey = self.keys.pop()
+        lastPriority = self.priorities.pop()
+        del self.position[key]
+        if self.keys:
+            self.keys[0] = lastKey
+            self.priorities[0] = lastPriority
+            self.position[lastKey] = 0
+            self.siftDown(0)
+        return key, priority
+
+    def siftUp(self, index):
+        key, priority = self.keys[index], self.priorities[index]
+        while index > 0:
+            parentIndex = (index - 1) // self.arity
+            if priority >= self.priorities[parentIndex]:
+                break
+            # move the parent down one level
+            self.keys[index] = self.keys[parentIndex]
+            self.priorities[index] = self.priorities[parentIndex]
+            self.position[self.keys[index]] = index
+            index = parentIndex
+        self.keys[index] = key
+        self.priorities[index] = priority
+        self.position[key] = index
+
+    def siftDown(self, index):
+        size = len(self.keys)
+        key, priority = self.keys[index], self.priorities[index]
+        while True:
+            firstChild = self.arity * index + 1
+            if firstChild >= size:
+                break
+            minChild = firstChild
+            for child in range(firstChild + 1, min(firstChild + self.arity, size)):
+                if self.priorities[child] < self.priorities[minChild]:
+                    minChild = child
+            if self.priorities[minChild] >= priority:
+                break
+            # move the smallest child up one level
+            self.keys[index] = self.keys[minChild]
+            self.priorities[index] = self.priorities[minChild]
+            self.position[self.keys[index]] = index
+            index = minChild
+        self.keys[index] = key
+        self.priorities[index] = priority
+        self.position[key] = index
+
+
+# heap = IndexedMinHeap(arity=4)
+# heap.push("A", 7)
+# heap.push("B", 3)
+# heap.push("C", 5)
+# heap.decrease_key("A", 1)
+# print(heap.pop())  # ('A', 1)
+# print(heap.pop())  # ('B', 3)
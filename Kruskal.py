@@ -2,6 +2,11 @@
 #   Copyright © 2021 AppMillers. All rights reserved.
 
 # Kruskal Algorithm  in Python
+import heapq
+import os
+import pickle
+import tempfile
+from itertools import islice
 import DisjointSet as dst
 
 class Graph:
@@ -36,6 +41,98 @@ class Graph:
                 ds.union(x,y)
         self.printSolution(s,d,w)
 
+    # Kruskal for edge sets that do not fit in memory
+    # edges: iterable of (s, d, w) or the path of a text file with one "s d w" edge per line
+    # the edges are sorted in runs of at most runSize, each run is spilled to a temporary file,
+    # and the runs are k-way merged lazily; reading stops as soon as the MST has V-1 edges
+    # at most mergeWidth runs are merged at once: whenever mergeWidth runs of the same level exist
+    # they are merged into one run of the next level, so only about mergeWidth * levels files are open
+    def kruskalStream(self, edges, runSize=100000, tmpDir=None, mergeWidth=64):
+        if runSize < 1:
+            raise ValueError("runSize must be at least 1")
+        # a merge of fewer than 2 runs never shrinks the run list
+        if mergeWidth < 2:
+            raise ValueError("mergeWidth must be at least 2")
+        if isinstance(edges, (str, os.PathLike)):
+            edges = readEdges(edges)
+        edges = iter(edges)
+        ds = dst.DisjointSet(self.nodes)
+        levels = []
+        try:
+            while True:
+                run = sorted(islice(edges, runSize), key=lambda item: item[2])
+                if not run:
+                    break
+                file = writeRun(run, tmpDir)
+                level = 0
+                while True:
+                    if level == len(levels):
+                        levels.append([])
+                    levels[level].append(file)
+                    if len(levels[level]) < mergeWidth:
+                        break
+                    file = mergeRuns(levels[level], tmpDir)
+                    levels[level] = []
+                    level += 1
+            # smallest runs first, so the final passes rewrite as little as possible
+            runs = [file for level in levels for file in level]
+            levels = [runs]
+            while len(runs) > mergeWidth:
+                runs[:mergeWidth] = [mergeRuns(runs[:mergeWidth], tmpDir)]
+            e = 0
+            for s, d, w in heapq.merge(*map(readRun, runs), key=lambda item: item[2]):
+                if ds.union(s, d):
+                    e += 1
+                    self.MST.append([s,d,w])
+                    if e == self.V - 1:
+                        break
+        finally:
+            for level in levels:
+                for file in level:
+                    file.close()
+        self.printSolution(None,None,None)
+
+# one "s d w" edge per line, w is read as int when possible
+def readEdges(path):
+    with open(path) as file:
+        for line in file:
+            if line.strip():
+                s, d, w = line.split()
+                try:
+                    w = int(w)
+                except ValueError:
+                    w = float(w)
+                yield [s, d, w]
+
+# spill sorted edges to a temporary file, pickled batchSize edges at a time
+def writeRun(edges, tmpDir=None, batchSize=4096):
+    file = tempfile.TemporaryFile(dir=tmpDir)
+    edges = iter(edges)
+    while True:
+        batch = [tuple(edge) for edge in islice(edges, batchSize)]
+        if not batch:
+            break
+        pickle.dump(batch, file, pickle.HIGHEST_PROTOCOL)
+    file.seek(0)
+    return file
+
+# merge sorted runs into one new run and close the old ones
+def mergeRuns(runs, tmpDir=None):
+    try:
+        return writeRun(heapq.merge(*map(readRun, runs), key=lambda item: item[2]), tmpDir)
+    finally:
+        for file in runs:
+            file.close()
+
+# edges of one sorted run, read back one batch at a time
+def readRun(file):
+    while True:
+        try:
+            batch = pickle.load(file)
+        except EOFError:
+            return
+        yield from batch
+
 g = Graph(5)
 g.addNode("A")
 g.addNode("B")
@@ -59,4 +156,8 @@ g.addEdge("E", "C", 20)
 
 g.kruskalAlgo()
 
+g2 = Graph(5)
+for node in ["A", "B", "C", "D", "E"]:
+    g2.addNode(node)
+g2.kruskalStream(g.graph, runSize=2, mergeWidth=2)
 
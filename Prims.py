@@ -2,20 +2,33 @@
 #   Copyright © 2021 AppMillers. All rights reserved.
 
 # Prims Algorithm  in Python
+import heapq
 import sys
+import numpy as np
 class Graph:
     def __init__(self, vertexNum, edges, nodes):
         self.edges = edges
         self.nodes = nodes
         self.vertexNum = vertexNum
         self.MST = []
+        # neighbor lists for mode="heap", built from the matrix on first use
+        self.adjacency = None
     
     def printSolution(self):
         print("Edge : Weight")
         for s, d, w in self.MST:
             print("%s -> %s: %s" % (s, d, w))
     
-    def primsAlgo(self):
+    # mode="scan": original version, rescans every visited row for every MST edge - O(V^3), prints the MST
+    # mode="dense": key array over all vertices, NumPy argmin + masked update per step - O(V^2), returns the MST
+    # mode="heap": lazy heap over the non-zero entries of each row - O(E log V), returns the MST
+    def primsAlgo(self, mode="scan"):
+        if mode == "dense":
+            return self.primsDense()
+        if mode == "heap":
+            return self.primsHeap()
+        if mode != "scan":
+            raise ValueError("mode must be 'scan', 'dense' or 'heap'")
         visited = [0]*self.vertexNum
         edgeNum=0
         visited[0]=True
@@ -34,6 +47,45 @@ class Graph:
             edgeNum += 1
         self.printSolution()
 
+    # key[v] = lightest edge from the tree to v, parent[v] = the tree end of that edge
+    def primsDense(self):
+        edges = np.asarray(self.edges, dtype=float)
+        key = np.full(self.vertexNum, np.inf)
+        parent = np.full(self.vertexNum, -1)
+        inTree = np.zeros(self.vertexNum, dtype=bool)
+        key[0] = 0
+        self.MST = []
+        for _ in range(self.vertexNum):
+            u = int(np.argmin(np.where(inTree, np.inf, key)))
+            if inTree[u] or key[u] == np.inf:
+                break
+            inTree[u] = True
+            if parent[u] != -1:
+                self.MST.append([self.nodes[parent[u]], self.nodes[u], self.edges[parent[u]][u]])
+            # 0 means no edge, as in primsAlgo
+            closer = ~inTree & (edges[u] != 0) & (edges[u] < key)
+            key[closer] = edges[u][closer]
+            parent[closer] = u
+        return self.MST
+
+    def primsHeap(self):
+        if self.adjacency is None:
+            self.adjacency = [[(j, w) for j, w in enumerate(row) if w] for row in self.edges]
+        visited = [False]*self.vertexNum
+        heap = [(0, 0, -1)]
+        self.MST = []
+        while heap and len(self.MST) < self.vertexNum-1:
+            w, d, s = heapq.heappop(heap)
+            if visited[d]:
+                continue
+            visited[d] = True
+            if s != -1:
+                self.MST.append([self.nodes[s], self.nodes[d], w])
+            for j, weight in self.adjacency[d]:
+                if not visited[j]:
+                    heapq.heappush(heap, (weight, j, d))
+        return self.MST
+
 
 
 edges = [[0, 10, 20, 0, 0],
@@ -44,3 +96,5 @@ edges = [[0, 10, 20, 0, 0],
 nodes = ["A","B","C","D","E"]
 g = Graph(5, edges, nodes)
 g.primsAlgo()
+print(g.primsAlgo(mode="dense"))
+print(g.primsAlgo(mode="heap"))
@@ -1,6 +1,7 @@
 #   Created by Elshad Karimov 
 #   Copyright © 2021 AppMillers. All rights reserved.
 
+from collections import deque
 
 class Graph:
     def __init__(self, gdict=None):
@@ -8,18 +9,46 @@ class Graph:
             gdict = {}
         self.gdict = gdict
     
+    # one parent per vertex instead of a copy of the path per edge; returns None if end is unreachable
     def bfs(self, start, end):
-        queue = []
-        queue.append([start])
+        parent = self.bfsTree(start, end)
+        if end not in parent:
+            return None
+        return getPath(parent, end)
+
+    # BFS tree from start: vertex -> the vertex it was first reached from (None for start)
+    # stops early once end has been reached
+    def bfsTree(self, start, end=None):
+        parent = {start : None}
+        queue = deque([start])
         while queue:
-            path = queue.pop(0)
-            node = path[-1]
+            node = queue.popleft()
             if node == end:
-                return path
+                break
             for adjacent in self.gdict.get(node, []):
-                new_path = list(path)
-                new_path.append(adjacent)
-                queue.append(new_path)
+                if adjacent not in parent:
+                    parent[adjacent] = node
+                    queue.append(adjacent)
+        return parent
+
+    # answers many (start, end) pairs with one BFS tree per distinct start
+    # returns {(start, end): path or None}
+    def bfsPaths(self, pairs):
+        trees = {}
+        paths = {}
+        for start, end in pairs:
+            if start not in trees:
+                trees[start] = self.bfsTree(start)
+            paths[(start, end)] = getPath(trees[start], end) if end in trees[start] else None
+        return paths
+
+# rebuild the route to end from the BFS tree only when it is asked for
+def getPath(parent, end):
+    path = []
+    while end is not None:
+        path.append(end)
+        end = parent[end]
+    return path[::-1]
 
 customDict = { "a" : ["b", "c"],
                "b" : ["d", "g"],
@@ -31,3 +60,4 @@ customDict = { "a" : ["b", "c"],
 
 g = Graph(customDict)
 print(g.bfs("a", "e"))
+print(g.bfsPaths([("a", "e"), ("a", "f"), ("b", "f"), ("b", "c")]))
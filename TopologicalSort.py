@@ -12,24 +12,58 @@ class Graph:
         self.graph[vertex].append(edge)
     
     def topogologicalSortUtil(self, v, visited, stack):
-        visited.append(v)
+        visited.add(v)
 
         for i in self.graph[v]:
             if i not in visited:
                 self.topogologicalSortUtil(i, visited, stack)
         
-        stack.insert(0, v)
+        stack.append(v)
     
     def topologicalSort(self):
 
-        visited = []
+        visited = set()
         stack = []
 
         for k in list(self.graph):
             if k not in visited:
                 self.topogologicalSortUtil(k, visited, stack)
         
-        print(stack)
+        # vertices were appended in finishing order, so the topological order is the reverse
+        print(stack[::-1])
+    
+    # Kahn's algorithm, iterative
+    # returns levels: level 0 has no dependencies, every vertex of level i + 1 only depends on
+    # vertices of levels 0..i, so all vertices of one level can be processed concurrently
+    def topologicalLevels(self):
+        inDegree = {}
+        for vertex in list(self.graph):
+            inDegree.setdefault(vertex, 0)
+            for i in self.graph[vertex]:
+                inDegree[i] = inDegree.get(i, 0) + 1
+
+        level = [vertex for vertex, degree in inDegree.items() if degree == 0]
+        levels = []
+        done = 0
+        while level:
+            levels.append(level)
+            done += len(level)
+            nextLevel = []
+            for vertex in level:
+                for i in self.graph.get(vertex, ()):
+                    inDegree[i] -= 1
+                    if inDegree[i] == 0:
+                        nextLevel.append(i)
+            level = nextLevel
+
+        # vertices on a cycle never reach in-degree 0
+        if done < len(inDegree):
+            raise ValueError("Graph contains a cycle")
+        return levels
+
+    # Kahn's algorithm order: the levels one after another
+    def kahnSort(self):
+        return [vertex for level in self.topologicalLevels() for vertex in level]
     
     
 
@@ -43,4 +77,6 @@ customGraph.addEdge("B", "D")
 customGraph.addEdge("B", "C")
 customGraph.addEdge("D", "F")
 
-customGraph.topologicalSort()
\ No newline at end of file
+customGraph.topologicalSort()
+print(customGraph.topologicalLevels())
+print(customGraph.kahnSort())
@@ -1,10 +1,24 @@
 from collections import deque
-from typing import List, Optional
+from typing import List
+
+import numpy as np
 
 
 class Graph:
     def __init__(self) -> None:
-        self.adj_matrix: List[List[int]] = []
+        # Allocated capacity x capacity; only the top-left num_vertices x num_vertices block is in use
+        self.matrix: np.ndarray = np.zeros((0, 0), dtype=bool)
+        self.num_vertices: int = 0
+
+    @property
+    def adj_matrix(self) -> List[List[int]]:
+        # A copy as the original 0/1 list of lists
+        return self.matrix[:self.num_vertices, :self.num_vertices].astype(np.int8).tolist()
+
+    @adj_matrix.setter
+    def adj_matrix(self, matrix: List[List[int]]) -> None:
+        self.matrix = np.array(matrix, dtype=bool).reshape(len(matrix), len(matrix))
+        self.num_vertices = len(matrix)
 
     # Function to insert a new edge between two vertices
     # Time Complexity: O(1)
@@ -18,29 +32,30 @@ class Graph:
         Example Usage: Used to add a new edge between two vertices in the graph.
         """
         max_vertex = max(source, destination)
-        if max_vertex >= len(self.adj_matrix):
+        if max_vertex >= self.num_vertices:
             # Expand the adjacency matrix if necessary
             self.expand_adj_matrix(max_vertex + 1)
-        self.adj_matrix[source][destination] = 1
-        self.adj_matrix[destination][source] = 1  # For undirected graph
+        self.matrix[source, destination] = True
+        self.matrix[destination, source] = True  # For undirected graph
 
     # Function to expand the adjacency matrix to accommodate more vertices
-    # Time Complexity: O(V^2), where V is the number of vertices
+    # Time Complexity: O(1) amortized per vertex, O(V^2) when the capacity has to grow
     # Space Complexity: O(V^2)
     def expand_adj_matrix(self, new_size: int) -> None:
         """
         Expands the adjacency matrix to accommodate more vertices.
 
-        Trick: Create a new adjacency matrix with the new size and copy existing values.
+        Trick: Keep spare capacity and at least double it whenever it runs out, copying the old block with a
+        single NumPy slice assignment, so inserting vertices 0..n one at a time costs O(n^2) in total instead of O(n^3).
 
         Example Usage: Used internally to resize the adjacency matrix when needed.
         """
-        old_size = len(self.adj_matrix)
-        new_adj_matrix = [[0] * new_size for _ in range(new_size)]
-        for i in range(old_size):
-            for j in range(old_size):
-                new_adj_matrix[i][j] = self.adj_matrix[i][j]
-        self.adj_matrix = new_adj_matrix
+        capacity = len(self.matrix)
+        if new_size > capacity:
+            new_matrix = np.zeros((max(new_size, 2 * capacity), max(new_size, 2 * capacity)), dtype=bool)
+            new_matrix[:capacity, :capacity] = self.matrix
+            self.matrix = new_matrix
+        self.num_vertices = max(self.num_vertices, new_size)
 
     # Function to delete an edge between two vertices
     # Time Complexity: O(1)
@@ -53,9 +68,9 @@ class Graph:
 
         Example Usage: Used to remove an edge between two vertices in the graph.
         """
-        if 0 <= source < len(self.adj_matrix) and 0 <= destination < len(self.adj_matrix):
-            self.adj_matrix[source][destination] = 0
-            self.adj_matrix[destination][source] = 0  # For undirected graph
+        if 0 <= source < self.num_vertices and 0 <= destination < self.num_vertices:
+            self.matrix[source, destination] = False
+            self.matrix[destination, source] = False  # For undirected graph
 
     # Function for breadth-first search (BFS) traversal of the graph
     # Time Complexity: O(V^2), where V is the number of vertices
@@ -64,51 +79,210 @@ class Graph:
         """
         Performs breadth-first search (BFS) traversal of the graph starting from a given vertex.
 
-        Trick: Use a queue to traverse the graph level by level, visiting all neighbors of each vertex before moving to the next level.
+        Trick: Use a queue to traverse the graph level by level. Each row is scanned in one vectorized step
+        (np.flatnonzero over row & ~visited) and neighbors are marked when enqueued, so each vertex is queued once.
 
         Example Usage: Used to traverse the graph in breadth-first order starting from a specific vertex.
         """
-        num_vertices = len(self.adj_matrix)
-        visited: List[bool] = [False] * num_vertices
+        num_vertices = self.num_vertices
+        visited = np.zeros(num_vertices, dtype=bool)
+        visited[start_vertex] = True
         result: List[int] = []
         queue: deque[int] = deque([start_vertex])
 
         while queue:
             vertex: int = queue.popleft()
-            if not visited[vertex]:
-                visited[vertex] = True
-                result.append(vertex)
-                for neighbor in range(num_vertices):
-                    if self.adj_matrix[vertex][neighbor] == 1 and not visited[neighbor]:
-                        queue.append(neighbor)
+            result.append(vertex)
+            neighbors = np.flatnonzero(self.matrix[vertex, :num_vertices] & ~visited)
+            visited[neighbors] = True
+            queue.extend(neighbors.tolist())
 
         return result
 
     # Function for depth-first search (DFS) traversal of the graph
     # Time Complexity: O(V^2), where V is the number of vertices
-    # Space Complexity: O(V)
+    # Space Complexity: O(V + E)
     def dfs(self, start_vertex: int) -> List[int]:
         """
         Performs depth-first search (DFS) traversal of the graph starting from a given vertex.
 
-        Trick: Use recursion to explore as far as possible along each branch before backtracking.
+        Trick: Explore as far as possible along each branch before backtracking. An explicit stack holds an iterator
+        over each vertex's neighbors (one np.flatnonzero per row), which visits vertices in the same order as recursion.
 
         Example Usage: Used to traverse the graph in depth-first order starting from a specific vertex.
         """
-        num_vertices = len(self.adj_matrix)
-        visited: List[bool] = [False] * num_vertices
+        num_vertices = self.num_vertices
+        visited = np.zeros(num_vertices, dtype=bool)
+        visited[start_vertex] = True
+        result: List[int] = [start_vertex]
+        stack = [iter(np.flatnonzero(self.matrix[start_vertex, :num_vertices]).tolist())]
+
+        while stack:
+            for neighbor in stack[-1]:
+                if not visited[neighbor]:
+                    visited[neighbor] = True
+                    result.append(neighbor)
+                    stack.append(iter(np.flatnonzero(self.matrix[neighbor, :num_vertices]).tolist()))
+                    break
+            else:
+                stack.pop()
+
+        return result
+
+
+class BitsetGraph:
+    """
+    Undirected unweighted graph whose adjacency matrix rows are bit-packed into Python ints.
+
+    Bit j of rows[i] is 1 when there is an edge between i and j, so a V x V matrix takes about V^2 / 8 bytes
+    instead of a Python object reference per cell. Set operations on neighborhoods become single bitwise
+    operations over whole machine words.
+    """
+    def __init__(self) -> None:
+        self.rows: List[int] = []
+
+    @property
+    def num_vertices(self) -> int:
+        return len(self.rows)
+
+    # Function to build a bitset graph from an adjacency matrix
+    # Time Complexity: O(V^2 / 8) byte operations
+    # Space Complexity: O(V^2 / 8)
+    @classmethod
+    def from_adj_matrix(cls, matrix) -> 'BitsetGraph':
+        """
+        Packs an adjacency matrix (List[List[int]], a NumPy array or Graph.adj_matrix) into bitset rows.
+
+        Trick: np.packbits with bitorder='little' puts column j at bit j, so int.from_bytes turns each packed
+        row straight into the row bitset.
+
+        Example Usage: BitsetGraph.from_adj_matrix(graph.adj_matrix)
+        """
+        graph = cls()
+        for row in np.asarray(matrix, dtype=bool):
+            graph.rows.append(int.from_bytes(np.packbits(row, bitorder='little').tobytes(), 'little'))
+        return graph
+
+    # Function to insert a new edge between two vertices
+    # Time Complexity: O(V / 64) word operations to set one bit in a Python int
+    # Space Complexity: O(1)
+    def insert_edge(self, source: int, destination: int) -> None:
+        """
+        Inserts a new edge between two vertices in the graph.
+
+        Trick: Set bit destination of rows[source] and bit source of rows[destination].
+
+        Example Usage: Used to add a new edge between two vertices in the graph.
+        """
+        max_vertex = max(source, destination)
+        if max_vertex >= len(self.rows):
+            # New vertices start with an empty row; no existing row has to be copied
+            self.rows.extend([0] * (max_vertex + 1 - len(self.rows)))
+        self.rows[source] |= 1 << destination
+        self.rows[destination] |= 1 << source  # For undirected graph
+
+    # Function to delete an edge between two vertices
+    # Time Complexity: O(V / 64)
+    # Space Complexity: O(1)
+    def delete_edge(self, source: int, destination: int) -> None:
+        """
+        Deletes an edge between two vertices in the graph.
+
+        Trick: Clear the two bits with AND NOT.
+
+        Example Usage: Used to remove an edge between two vertices in the graph.
+        """
+        if 0 <= source < len(self.rows) and 0 <= destination < len(self.rows):
+            self.rows[source] &= ~(1 << destination)
+            self.rows[destination] &= ~(1 << source)  # For undirected graph
+
+    def has_edge(self, source: int, destination: int) -> bool:
+        return bool(self.rows[source] >> destination & 1)
+
+    def degree(self, vertex: int) -> int:
+        return self.rows[vertex].bit_count()
+
+    # Function to list the vertices whose bits are set in a bitset
+    # Time Complexity: O(K * V / 64) where K is the number of set bits
+    # Space Complexity: O(K)
+    @staticmethod
+    def members(bits: int) -> List[int]:
+        """
+        Returns the positions of the 1 bits in increasing order.
+
+        Trick: bits & -bits isolates the lowest set bit; bit_length gives its position.
+
+        Example Usage: BitsetGraph.members(graph.rows[v]) lists the neighbors of v.
+        """
         result: List[int] = []
+        while bits:
+            lowest = bits & -bits
+            result.append(lowest.bit_length() - 1)
+            bits ^= lowest
+        return result
 
-        def dfs_util(vertex: int) -> None:
-            visited[vertex] = True
-            result.append(vertex)
-            for neighbor in range(num_vertices):
-                if self.adj_matrix[vertex][neighbor] == 1 and not visited[neighbor]:
-                    dfs_util(neighbor)
+    def neighbors(self, vertex: int) -> List[int]:
+        return self.members(self.rows[vertex])
+
+    # Function to count the neighbors two vertices have in common
+    # Time Complexity: O(V / 64)
+    # Space Complexity: O(V / 64)
+    def common_neighbors(self, u: int, v: int) -> int:
+        """
+        Counts the vertices adjacent to both u and v.
+
+        Trick: One AND of the two rows followed by a popcount (int.bit_count).
+
+        Example Usage: Used for similarity scores such as Jaccard or Adamic-Adar on dense graphs.
+        """
+        return (self.rows[u] & self.rows[v]).bit_count()
+
+    # Function for breadth-first search (BFS) traversal of the graph
+    # Time Complexity: O(V^2 / 64) word operations
+    # Space Complexity: O(V)
+    def bfs(self, start_vertex: int) -> List[int]:
+        """
+        Performs level-synchronous breadth-first search (BFS) traversal starting from a given vertex.
+
+        Trick: The next frontier is the OR of the frontier's rows with the visited bits masked out, so a whole
+        level is expanded with word-wide ORs instead of one neighbor check per cell. Within a level the
+        vertices come out in increasing order.
+
+        Example Usage: Used to traverse the graph in breadth-first order starting from a specific vertex.
+        """
+        visited = 1 << start_vertex
+        frontier = [start_vertex]
+        result: List[int] = [start_vertex]
+
+        while frontier:
+            reached = 0
+            for vertex in frontier:
+                reached |= self.rows[vertex]
+            reached &= ~visited
+            visited |= reached
+            frontier = self.members(reached)
+            result.extend(frontier)
 
-        dfs_util(start_vertex)
         return result
 
+    # Function to count the triangles in the graph
+    # Time Complexity: O(E * V / 64) word operations
+    # Space Complexity: O(V / 64)
+    def triangle_count(self) -> int:
+        """
+        Counts the triangles (3-cliques) of the graph.
+
+        Trick: For every edge (u, v) with u < v, the third corners w > v are the bits of rows[u] & rows[v]
+        above v; counting them with one popcount per edge counts each triangle exactly once.
+
+        Example Usage: Used for clustering coefficients and dense-subgraph detection.
+        """
+        triangles = 0
+        for u, row in enumerate(self.rows):
+            higher = row >> (u + 1) << (u + 1)
+            for v in self.members(higher):
+                triangles += (row & self.rows[v] & ~((2 << v) - 1)).bit_count()
+        return triangles
 
 # Example usage:
 if __name__ == "__main__":
@@ -138,3 +312,12 @@ if __name__ == "__main__":
     print("\nBFS Traversal after deleting edge (2, 4):")
     # Expected output: [0, 1, 2, 3]
     print(graph.bfs(0))
+
+    # Bit-packed version of the same graph
+    bitset_graph: BitsetGraph = BitsetGraph.from_adj_matrix(graph.adj_matrix)
+    bitset_graph.insert_edge(1, 2)
+    print("\nBitset BFS Traversal:")
+    # Expected output: [0, 1, 2, 3]
+    print(bitset_graph.bfs(0))
+    print("Triangles:", bitset_graph.triangle_count())  # Expected output: 1
+    print("Common neighbors of 1 and 2:", bitset_graph.common_neighbors(1, 2))  # Expected output: 1
@@ -1,10 +1,35 @@
 from collections import deque
 from typing import List, Optional
 
+import numpy as np
+
 
 class Graph:
-    def __init__(self) -> None:
-        self.adj_matrix: List[List[Optional[int]]] = []
+    def __init__(self, dtype: Optional[np.dtype] = None) -> None:
+        # Allocated capacity x capacity; only the top-left num_vertices x num_vertices block is in use.
+        # weights holds the edge weights, has_edge marks which cells are edges (so a weight of 0 is allowed).
+        # With dtype None the weights start as int64 and switch to float64 at the first non-integer weight
+        self.fixed_dtype: bool = dtype is not None
+        self.weights: np.ndarray = np.zeros((0, 0), dtype=np.int64 if dtype is None else dtype)
+        self.has_edge: np.ndarray = np.zeros((0, 0), dtype=bool)
+        self.num_vertices: int = 0
+
+    @property
+    def adj_matrix(self) -> List[List[Optional[int]]]:
+        # A copy as the original list of lists, None where there is no edge
+        n = self.num_vertices
+        return np.where(self.has_edge[:n, :n], self.weights[:n, :n], None).tolist()
+
+    @adj_matrix.setter
+    def adj_matrix(self, matrix: List[List[Optional[int]]]) -> None:
+        self.weights = np.zeros((0, 0), dtype=self.weights.dtype if self.fixed_dtype else np.int64)
+        self.has_edge = np.zeros((0, 0), dtype=bool)
+        self.num_vertices = 0
+        self.expand_adj_matrix(len(matrix))
+        for source, row in enumerate(matrix):
+            for destination, weight in enumerate(row):
+                if weight is not None:
+                    self.insert_edge(source, destination, weight)
 
     # Function to insert a new edge between two vertices with weight
     # Time Complexity: O(1)
@@ -18,28 +43,36 @@ class Graph:
         Example Usage: Used to add a new edge between two vertices in the graph.
         """
         max_vertex = max(source, destination)
-        if max_vertex >= len(self.adj_matrix):
+        if max_vertex >= self.num_vertices:
             # Expand the adjacency matrix if necessary
             self.expand_adj_matrix(max_vertex + 1)
-        self.adj_matrix[source][destination] = weight
+        if not self.fixed_dtype and self.weights.dtype.kind in 'iu' and not isinstance(weight, (int, np.integer)):
+            # Upcast once instead of truncating a fractional weight
+            self.weights = self.weights.astype(np.float64)
+        self.weights[source, destination] = weight
+        self.has_edge[source, destination] = True
 
     # Function to expand the adjacency matrix to accommodate more vertices
-    # Time Complexity: O(V^2), where V is the number of vertices
+    # Time Complexity: O(1) amortized per vertex, O(V^2) when the capacity has to grow
     # Space Complexity: O(V^2)
     def expand_adj_matrix(self, new_size: int) -> None:
         """
         Expands the adjacency matrix to accommodate more vertices.
 
-        Trick: Create a new adjacency matrix with the new size and copy existing values.
+        Trick: Keep spare capacity and at least double it whenever it runs out, copying the old block with a
+        single NumPy slice assignment, so inserting vertices 0..n one at a time costs O(n^2) in total instead of O(n^3).
 
         Example Usage: Used internally to resize the adjacency matrix when needed.
         """
-        old_size = len(self.adj_matrix)
-        new_adj_matrix = [[None] * new_size for _ in range(new_size)]
-        for i in range(old_size):
-            for j in range(old_size):
-                new_adj_matrix[i][j] = self.adj_matrix[i][j]
-        self.adj_matrix = new_adj_matrix
+        capacity = len(self.weights)
+        if new_size > capacity:
+            new_capacity = max(new_size, 2 * capacity)
+            new_weights = np.zeros((new_capacity, new_capacity), dtype=self.weights.dtype)
+            new_weights[:capacity, :capacity] = self.weights
+            new_has_edge = np.zeros((new_capacity, new_capacity), dtype=bool)
+            new_has_edge[:capacity, :capacity] = self.has_edge
+            self.weights, self.has_edge = new_weights, new_has_edge
+        self.num_vertices = max(self.num_vertices, new_size)
 
     # Function to delete an edge between two vertices
     # Time Complexity: O(1)
@@ -48,12 +81,13 @@ class Graph:
         """
         Deletes an edge between two vertices in the graph.
 
-        Trick: Set the corresponding cell in the adjacency matrix to None to delete the edge.
+        Trick: Clear the corresponding cell of has_edge to delete the edge.
 
         Example Usage: Used to remove an edge between two vertices in the graph.
         """
-        if 0 <= source < len(self.adj_matrix) and 0 <= destination < len(self.adj_matrix):
-            self.adj_matrix[source][destination] = None
+        if 0 <= source < self.num_vertices and 0 <= destination < self.num_vertices:
+            self.has_edge[source, destination] = False
+            self.weights[source, destination] = 0
 
     # Function for breadth-first search (BFS) traversal of the graph
     # Time Complexity: O(V^2), where V is the number of vertices
@@ -62,49 +96,54 @@ class Graph:
         """
         Performs breadth-first search (BFS) traversal of the graph starting from a given vertex.
 
-        Trick: Use a queue to traverse the graph level by level, visiting all neighbors of each vertex before moving to the next level.
+        Trick: Use a queue to traverse the graph level by level. Each row is scanned in one vectorized step
+        (np.flatnonzero over has_edge & ~visited) and neighbors are marked when enqueued, so each vertex is queued once.
 
         Example Usage: Used to traverse the graph in breadth-first order starting from a specific vertex.
         """
-        num_vertices = len(self.adj_matrix)
-        visited: List[bool] = [False] * num_vertices
+        num_vertices = self.num_vertices
+        visited = np.zeros(num_vertices, dtype=bool)
+        visited[start_vertex] = True
         result: List[int] = []
         queue: deque[int] = deque([start_vertex])
 
         while queue:
             vertex: int = queue.popleft()
-            if not visited[vertex]:
-                visited[vertex] = True
-                result.append(vertex)
-                for neighbor in range(num_vertices):
-                    if self.adj_matrix[vertex][neighbor] is not None and not visited[neighbor]:
-                        queue.append(neighbor)
+            result.append(vertex)
+            neighbors = np.flatnonzero(self.has_edge[vertex, :num_vertices] & ~visited)
+            visited[neighbors] = True
+            queue.extend(neighbors.tolist())
 
         return result
 
     # Function for depth-first search (DFS) traversal of the graph
     # Time Complexity: O(V^2), where V is the number of vertices
-    # Space Complexity: O(V)
+    # Space Complexity: O(V + E)
     def dfs(self, start_vertex: int) -> List[int]:
         """
         Performs depth-first search (DFS) traversal of the graph starting from a given vertex.
 
-        Trick: Use recursion to explore as far as possible along each branch before backtracking.
+        Trick: Explore as far as possible along each branch before backtracking. An explicit stack holds an iterator
+        over each vertex's neighbors (one np.flatnonzero per row), which visits vertices in the same order as recursion.
 
         Example Usage: Used to traverse the graph in depth-first order starting from a specific vertex.
         """
-        num_vertices = len(self.adj_matrix)
-        visited: List[bool] = [False] * num_vertices
-        result: List[int] = []
-
-        def dfs_util(vertex: int) -> None:
-            visited[vertex] = True
-            result.append(vertex)
-            for neighbor in range(num_vertices):
-                if self.adj_matrix[vertex][neighbor] is not None and not visited[neighbor]:
-                    dfs_util(neighbor)
+        num_vertices = self.num_vertices
+        visited = np.zeros(num_vertices, dtype=bool)
+        visited[start_vertex] = True
+        result: List[int] = [start_vertex]
+        stack = [iter(np.flatnonzero(self.has_edge[start_vertex, :num_vertices]).tolist())]
+
+        while stack:
+            for neighbor in stack[-1]:
+                if not visited[neighbor]:
+                    visited[neighbor] = True
+                    result.append(neighbor)
+                    stack.append(iter(np.flatnonzero(self.has_edge[neighbor, :num_vertices]).tolist()))
+                    break
+            else:
+                stack.pop()
 
-        dfs_util(start_vertex)
         return result
 
 
@@ -1,5 +1,9 @@
 from collections import defaultdict, deque
-from typing import List, Dict, Set, Tuple
+import heapq
+import pickle
+from typing import Callable, List, Dict, Set, Tuple
+
+import graph_csr
 
 # Depth First Search (DFS) Algorithm
 def dfs(graph: Dict[int, List[int]], start: int) -> List[int]:
@@ -7,6 +11,7 @@ def dfs(graph: Dict[int, List[int]], start: int) -> List[int]:
     DFS algorithm to traverse a graph starting from a given node.
 
     Assumption: The graph is represented using an adjacency list.
+    CSR: A graph_csr.CSRGraph is accepted as well; vertices (start and results) are then its integer ids.
     Type Annotation:
         graph: Dict[int, List[int]] - Adjacency list representation of the graph.
         start: int - Starting node for DFS traversal.
@@ -14,6 +19,9 @@ def dfs(graph: Dict[int, List[int]], start: int) -> List[int]:
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Use a stack (or recursion) to keep track of nodes to visit.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.dfs(graph, start)
+
     visited = set()
     traversal_order = []
 
@@ -33,26 +41,58 @@ def bfs(graph: Dict[int, List[int]], start: int) -> List[int]:
     BFS algorithm to traverse a graph starting from a given node.
 
     Assumption: The graph is represented using an adjacency list.
+    CSR: A graph_csr.CSRGraph is accepted as well; vertices (start and results) are then its integer ids.
     Type Annotation:
         graph: Dict[int, List[int]] - Adjacency list representation of the graph.
         start: int - Starting node for BFS traversal.
     Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
     Space Complexity: O(V) where V is the number of vertices.
-    Trick: Use a queue to keep track of nodes to visit.
+    Trick: Use a queue to keep track of nodes to visit. Mark nodes when they are enqueued so each one enters the queue once.
     """
-    visited = set()
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.bfs(graph, start)
+
+    visited = {start}
     traversal_order = []
     queue = deque([start])
 
     while queue:
         node = queue.popleft()
-        if node not in visited:
-            visited.add(node)
-            traversal_order.append(node)
-            queue.extend(neighbor for neighbor in graph[node] if neighbor not in visited)
+        traversal_order.append(node)
+        for neighbor in graph[node]:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append(neighbor)
 
     return traversal_order
 
+# Direction-Optimizing BFS
+def direction_optimizing_bfs(graph: Dict[int, List[int]], start: int) -> Tuple[Dict[int, int], Dict[int, int]]:
+    """
+    Level-synchronous BFS that switches between top-down and bottom-up steps, returning the BFS tree.
+
+    Assumption: The graph is represented using an adjacency list (directed or undirected).
+    CSR: A graph_csr.CSRGraph is accepted as well; the result is then (depth, parent) arrays indexed by vertex id.
+    Type Annotation:
+        graph: Dict[int, List[int]] - Adjacency list representation of the graph.
+        start: int - Starting node for BFS traversal.
+    Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Space Complexity: O(V + E) for the CSR copy of the graph.
+    Trick: Runs graph_csr.direction_optimizing_bfs - a top-down step pushes from a list frontier to every unvisited
+    neighbor (the depth array doubles as the visited mark); once the frontier is large it is turned into a bytearray
+    and the unvisited nodes look for a parent in it instead.
+    Returns: (depth, parent) - {node: number of edges from start} and {node: BFS parent}, reachable nodes only;
+    parent[start] = start.
+    """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.direction_optimizing_bfs(graph, start)
+
+    csr = graph_csr.CSRGraph.from_adjacency_list(graph, weighted=False)
+    depth, parent = graph_csr.direction_optimizing_bfs(csr, csr.vertex_id(start))
+    label = csr.vertex_label
+    reached = [v for v in range(csr.num_vertices) if depth[v] != -1]
+    return {label(v): depth[v] for v in reached}, {label(v): label(parent[v]) for v in reached}
+
 # Union Find Algorithm (Disjoint Set Union)
 class UnionFind:
     """
@@ -94,12 +134,16 @@ def topological_sort(graph: Dict[int, List[int]]) -> List[int]:
     Topological sort algorithm to find the linear ordering of vertices in a directed acyclic graph (DAG).
 
     Assumption: The graph is a directed acyclic graph (DAG).
+    CSR: A graph_csr.CSRGraph is accepted as well; the order is then over its integer vertex ids.
     Type Annotation:
         graph: Dict[int, List[int]] - Adjacency list representation of the graph.
     Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Use DFS and stack to order the vertices.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.topological_sort(graph)
+
     visited = set()
     stack = []
 
@@ -116,12 +160,155 @@ def topological_sort(graph: Dict[int, List[int]]) -> List[int]:
 
     return stack[::-1]
 
+# Strongly Connected Components (Tarjan)
+def strongly_connected_components(graph: Dict[int, List[int]]) -> List[List[int]]:
+    """
+    Tarjan's algorithm to find the strongly connected components (SCCs) of a directed graph.
+
+    Assumption: The graph is directed.
+    CSR: A graph_csr.CSRGraph is accepted as well; the result is then (component id per vertex, count).
+    Type Annotation:
+        graph: Dict[int, List[int]] - Adjacency list representation of the graph.
+    Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Space Complexity: O(V + E) for the CSR copy of the graph.
+    Trick: Runs the explicit-stack graph_csr.strongly_connected_components, so long chains do not hit the
+    recursion limit; the components come out in topological order.
+    Returns: One list of nodes per component; edges between components only go from earlier to later lists.
+    """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.strongly_connected_components(graph)
+
+    csr = graph_csr.CSRGraph.from_adjacency_list(graph, weighted=False)
+    component, count = graph_csr.strongly_connected_components(csr)
+    components = [[] for _ in range(count)]
+    for v in range(csr.num_vertices):
+        components[component[v]].append(csr.vertex_label(v))
+    return components
+
+# Condensation Graph
+def condensation(graph: Dict[int, List[int]]) -> Tuple[Dict[int, List[int]], Dict[int, int]]:
+    """
+    Collapses every strongly connected component of a directed graph into a single node.
+
+    Assumption: The graph is directed.
+    CSR: A graph_csr.CSRGraph is accepted as well; the result is then (condensation CSRGraph, component id array).
+    Type Annotation:
+        graph: Dict[int, List[int]] - Adjacency list representation of the graph.
+    Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Space Complexity: O(V + E)
+    Trick: The condensation is a DAG in the same adjacency-list format, so it can go straight into
+    topological_sort; u reaches v exactly when component[u] reaches component[v] in it, and u lies on a cycle
+    exactly when its component has more than one node (or a self-loop).
+    Returns: (dag, component) - {component id: [component ids]} without duplicate edges, and {node: component id}.
+    """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.condensation(graph)
+
+    csr = graph_csr.CSRGraph.from_adjacency_list(graph, weighted=False)
+    dag, component = graph_csr.condensation(csr)
+    return ({c: list(dag.neighbors(c)) for c in range(dag.num_vertices)},
+            {csr.vertex_label(v): component[v] for v in range(csr.num_vertices)})
+
+# Dynamic Topological Order (Pearce-Kelly)
+class DynamicTopologicalOrder:
+    """
+    Topological order of a DAG that is kept up to date while edges are inserted.
+
+    Assumption: The graph is directed and must stay acyclic; an insertion that would close a cycle is rejected.
+    Time Complexity:
+        - Initialization: O(V + E)
+        - Add Edge: O(1) when u already comes before v, otherwise O(A * log(A)) where A is the size of the
+          affected region (the nodes ordered between v and u that are reachable from v or reach u).
+        - Order: O(V)
+    Space Complexity: O(V + E)
+    Trick: Only an edge u -> v with u after v breaks the order. Search forward from v and backward from u, both
+    restricted to the positions between v and u; if the forward search meets u the edge closes a cycle. Otherwise
+    the two node sets swap places: reuse their own positions, giving the backward set the lowest ones.
+    """
+    def __init__(self, graph: Dict[int, List[int]] = None):
+        self.successors: Dict[int, Set[int]] = {}
+        self.predecessors: Dict[int, Set[int]] = {}
+        self.position: Dict[int, int] = {}
+        self.nodes: List[int] = []
+        if graph:
+            # Bulk-load the edges, then seed the order with a single Kahn pass
+            for node, neighbors in graph.items():
+                self.successors.setdefault(node, set()).update(neighbors)
+                self.predecessors.setdefault(node, set())
+                for neighbor in neighbors:
+                    self.successors.setdefault(neighbor, set())
+                    self.predecessors.setdefault(neighbor, set()).add(node)
+            in_degree = {node: len(predecessors) for node, predecessors in self.predecessors.items()}
+            queue = deque(node for node, degree in in_degree.items() if degree == 0)
+            while queue:
+                node = queue.popleft()
+                self.position[node] = len(self.nodes)
+                self.nodes.append(node)
+                for neighbor in self.successors[node]:
+                    in_degree[neighbor] -= 1
+                    if in_degree[neighbor] == 0:
+                        queue.append(neighbor)
+            if len(self.nodes) != len(self.successors):
+                raise ValueError("graph contains a cycle")
+
+    def add_node(self, node: int) -> None:
+        if node not in self.position:
+            self.position[node] = len(self.nodes)
+            self.nodes.append(node)
+            self.successors[node] = set()
+            self.predecessors[node] = set()
+
+    def add_edge(self, u: int, v: int) -> None:
+        self.add_node(u)
+        self.add_node(v)
+        if v in self.successors[u]:
+            return
+        if u == v:
+            raise ValueError(f"edge {u} -> {v} would create a cycle")
+        lower, upper = self.position[v], self.position[u]
+        if lower < upper:
+            forward = self._search(v, self.successors, lambda position: position <= upper, u)
+            if forward is None:
+                raise ValueError(f"edge {u} -> {v} would create a cycle")
+            backward = self._search(u, self.predecessors, lambda position: position >= lower)
+            self._reorder(backward, forward)
+        self.successors[u].add(v)
+        self.predecessors[v].add(u)
+
+    def order(self) -> List[int]:
+        return list(self.nodes)
+
+    def _search(self, start: int, edges: Dict[int, Set[int]], inside: Callable[[int], bool],
+                stop: int = None) -> List[int]:
+        # Iterative DFS over the nodes whose position is inside the affected region; None when stop is reached
+        seen = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for neighbor in edges[node]:
+                if neighbor == stop:
+                    return None
+                if neighbor not in seen and inside(self.position[neighbor]):
+                    seen.add(neighbor)
+                    stack.append(neighbor)
+        return list(seen)
+
+    def _reorder(self, backward: List[int], forward: List[int]) -> None:
+        backward.sort(key=self.position.__getitem__)
+        forward.sort(key=self.position.__getitem__)
+        moved = backward + forward
+        slots = sorted(self.position[node] for node in moved)
+        for node, slot in zip(moved, slots):
+            self.position[node] = slot
+            self.nodes[slot] = node
+
 # Dijkstra's Algorithm
 def dijkstra(graph: Dict[int, List[Tuple[int, int]]], start: int) -> Dict[int, int]:
     """
     Dijkstra's algorithm to find the shortest paths from a single source node to all other nodes in a graph.
 
     Assumption: The graph is weighted and does not contain negative edge weights.
+    CSR: A graph_csr.CSRGraph is accepted as well; vertices (start and results) are then its integer ids.
     Type Annotation:
         graph: Dict[int, List[Tuple[int, int]]] - Weighted adjacency list representation of the graph.
         start: int - Starting node for Dijkstra's algorithm.
@@ -129,6 +316,9 @@ def dijkstra(graph: Dict[int, List[Tuple[int, int]]], start: int) -> Dict[int, i
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Use priority queue (heapq) to efficiently select the next vertex with the smallest distance.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.dijkstra(graph, start)
+
     distances = {node: float('inf') for node in graph}
     distances[start] = 0
     pq = [(0, start)]
@@ -144,18 +334,292 @@ def dijkstra(graph: Dict[int, List[Tuple[int, int]]], start: int) -> Dict[int, i
 
     return distances
 
+# Multi-Source Dijkstra (Nearest-Source Labeling)
+def multi_source_dijkstra(graph: Dict[int, List[Tuple[int, int]]], sources: List[int]) -> Tuple[Dict[int, int], Dict[int, int]]:
+    """
+    Shortest distance from every node to its nearest source, with one search instead of one per source.
+
+    Assumption: The graph is weighted and does not contain negative edge weights.
+    CSR: A graph_csr.CSRGraph is accepted as well; the result is then (distances, nearest) arrays indexed by vertex id.
+    Type Annotation:
+        graph: Dict[int, List[Tuple[int, int]]] - Weighted adjacency list representation of the graph.
+        sources: List[int] - Source nodes (e.g. every warehouse).
+    Time Complexity: O((V + E) * log(V)) in total, however many sources there are.
+    Space Complexity: O(V) where V is the number of vertices.
+    Trick: Start the priority queue with every source at distance 0; a node is settled by whichever source
+    reaches it first and takes that source as its label.
+    Returns: (distances, nearest) - {node: distance to the nearest source} and {node: that source}, reachable nodes only.
+    """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.multi_source_dijkstra(graph, sources)
+
+    distances = {source: 0 for source in sources}
+    nearest = {source: source for source in sources}
+    pq = [(0, source) for source in distances]
+    heapq.heapify(pq)
+
+    while pq:
+        distance, node = heapq.heappop(pq)
+        if distance > distances[node]:
+            continue
+        for neighbor, weight in graph[node]:
+            if distance + weight < distances.get(neighbor, float('inf')):
+                distances[neighbor] = distance + weight
+                nearest[neighbor] = nearest[node]
+                heapq.heappush(pq, (distance + weight, neighbor))
+
+    return distances, nearest
+
+# Batched Single-Source Dijkstra
+def dijkstra_many(graph: Dict[int, List[Tuple[int, int]]], sources: List[int],
+                  processes: int = None) -> Dict[int, Dict[int, int]]:
+    """
+    Separate shortest-path distances from each of many sources, optionally spread over a process pool.
+
+    Assumption: The graph is weighted and does not contain negative edge weights.
+    CSR: A graph_csr.CSRGraph is accepted as well; the result is then one distance array per source.
+    Type Annotation:
+        graph: Dict[int, List[Tuple[int, int]]] - Weighted adjacency list representation of the graph.
+        sources: List[int] - Source nodes.
+        processes: int - Run the searches on a multiprocessing.Pool of this size (None = serial).
+    Time Complexity: O(S * (V + E) * log(V)) work for S sources, divided over the processes.
+    Space Complexity: O(S * V) for the result.
+    Trick: The graph is converted to CSR once and graph_csr.dijkstra_many places its arrays in shared memory,
+    so the workers read one copy of the graph and receive only a source id per task.
+    Returns: {source: {node: distance}} with unreachable nodes at inf, like dijkstra. Distances are ints when every
+    weight is an int, in both modes.
+    """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.dijkstra_many(graph, sources, processes)
+
+    if processes is None:
+        return {source: dijkstra(graph, source) for source in sources}
+    csr = graph_csr.CSRGraph.from_adjacency_list(graph, weighted=True)
+    rows = graph_csr.dijkstra_many(csr, [csr.vertex_id(source) for source in sources], processes)
+    nodes = [csr.vertex_label(v) for v in range(csr.num_vertices)]
+    # The CSR rows are float64; give back the same types the serial dijkstra returns
+    integral = all(isinstance(weight, int) for neighbors in graph.values() for _, weight in neighbors)
+    results = {}
+    for source, row in zip(sources, rows):
+        distances = {node: int(distance) if integral and distance != float('inf') else distance
+                     for node, distance in zip(nodes, row)}
+        distances[source] = 0
+        results[source] = distances
+    return results
+
+# Reverse Graph (Transpose)
+def reverse_graph(graph: Dict[int, List[Tuple[int, int]]]) -> Dict[int, List[Tuple[int, int]]]:
+    """
+    Builds the transpose of a weighted directed graph (every edge u -> v becomes v -> u).
+
+    Type Annotation:
+        graph: Dict[int, List[Tuple[int, int]]] - Weighted adjacency list representation of the graph.
+    Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Space Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Trick: Build it once and pass it to every point-to-point query instead of rebuilding it per query.
+    """
+    reversed_graph = {node: [] for node in graph}
+    for node, neighbors in graph.items():
+        for neighbor, weight in neighbors:
+            reversed_graph.setdefault(neighbor, []).append((node, weight))
+    return reversed_graph
+
+# Bidirectional Dijkstra's Algorithm
+def bidirectional_dijkstra(graph: Dict[int, List[Tuple[int, int]]], start: int, target: int,
+                           reversed_graph: Dict[int, List[Tuple[int, int]]] = None) -> Tuple[float, List[int]]:
+    """
+    Bidirectional Dijkstra's algorithm to find the shortest path between a single pair of nodes.
+
+    Assumption: The graph is weighted and does not contain negative edge weights.
+    CSR: A graph_csr.CSRGraph is accepted as well; vertices (start, target and the path) are then its integer ids.
+    Type Annotation:
+        graph: Dict[int, List[Tuple[int, int]]] - Weighted adjacency list representation of the graph.
+        start: int - Source node.
+        target: int - Destination node.
+        reversed_graph: Dict[int, List[Tuple[int, int]]] - Optional transpose of graph (see reverse_graph).
+    Time Complexity: O((V + E) * log(V)) worst case, but only the two balls around start and target are settled.
+    Space Complexity: O(V) where V is the number of vertices.
+    Trick: Search forward from start and backward from target at the same time. Stop as soon as the two
+    smallest frontier distances add up to at least the best start -> meeting node -> target distance seen so far.
+    Returns: (distance, path) - (inf, []) when target is unreachable.
+    """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.bidirectional_dijkstra(graph, start, target, reversed_graph)
+
+    if start == target:
+        return 0, [start]
+    if reversed_graph is None:
+        reversed_graph = reverse_graph(graph)
+
+    graphs = (graph, reversed_graph)
+    distances = ({start: 0}, {target: 0})
+    parents = ({start: None}, {target: None})
+    settled = (set(), set())
+    pqs = ([(0, start)], [(0, target)])
+    best = float('inf')
+    meeting = None
+
+    while pqs[0] and pqs[1]:
+        if pqs[0][0][0] + pqs[1][0][0] >= best:
+            break
+        side = 0 if pqs[0][0][0] <= pqs[1][0][0] else 1
+        distance, node = heapq.heappop(pqs[side])
+        if node in settled[side]:
+            continue
+        settled[side].add(node)
+        for neighbor, weight in graphs[side].get(node, ()):
+            new_distance = distance + weight
+            if new_distance < distances[side].get(neighbor, float('inf')):
+                distances[side][neighbor] = new_distance
+                parents[side][neighbor] = node
+                heapq.heappush(pqs[side], (new_distance, neighbor))
+            if neighbor in distances[1 - side]:
+                total = distances[side][neighbor] + distances[1 - side][neighbor]
+                if total < best:
+                    best = total
+                    meeting = neighbor
+
+    if meeting is None:
+        return float('inf'), []
+    path = []
+    node = meeting
+    while node is not None:
+        path.append(node)
+        node = parents[0][node]
+    path.reverse()
+    node = parents[1][meeting]
+    while node is not None:
+        path.append(node)
+        node = parents[1][node]
+    return best, path
+
+# A* Search Algorithm
+def astar(graph: Dict[int, List[Tuple[int, int]]], start: int, target: int,
+          heuristic: Callable[[int, int], float]) -> Tuple[float, List[int]]:
+    """
+    A* search to find the shortest path between a single pair of nodes using a lower-bound heuristic.
+
+    Assumption: The graph has no negative edge weights and heuristic(node, target) never overestimates
+    the remaining distance (admissible). It may return inf to prune nodes that cannot reach target.
+    Type Annotation:
+        graph: Dict[int, List[Tuple[int, int]]] - Weighted adjacency list representation of the graph.
+        start: int - Source node.
+        target: int - Destination node.
+        heuristic: Callable[[int, int], float] - Lower bound on the distance from a node to target.
+    Time Complexity: O((V + E) * log(V)) worst case; a good heuristic settles far fewer nodes than dijkstra.
+    Space Complexity: O(V) where V is the number of vertices.
+    Trick: Order the heap by distance + heuristic. Stale entries are skipped by comparing their distance,
+    so a node can be reopened and an inconsistent (but admissible) heuristic still gives exact results.
+    Returns: (distance, path) - (inf, []) when target is unreachable.
+    """
+    distances = {start: 0}
+    parents = {start: None}
+    pq = [(heuristic(start, target), 0, start)]
+
+    while pq:
+        _, distance, node = heapq.heappop(pq)
+        if distance > distances[node]:
+            continue
+        if node == target:
+            path = []
+            while node is not None:
+                path.append(node)
+                node = parents[node]
+            return distance, path[::-1]
+        for neighbor, weight in graph[node]:
+            new_distance = distance + weight
+            if new_distance < distances.get(neighbor, float('inf')):
+                estimate = heuristic(neighbor, target)
+                if estimate == float('inf'):
+                    continue
+                distances[neighbor] = new_distance
+                parents[neighbor] = node
+                heapq.heappush(pq, (new_distance + estimate, new_distance, neighbor))
+
+    return float('inf'), []
+
+# ALT (A*, Landmarks, Triangle inequality) Heuristic
+class LandmarkTable:
+    """
+    Precomputed landmark distances that give A* an admissible heuristic on any weighted graph.
+
+    Assumption: The graph has no negative edge weights.
+    Time Complexity:
+        - Build: O(L * (V + E) * log(V)) where L is the number of landmarks.
+        - Heuristic: O(L)
+    Space Complexity: O(L * V)
+    Trick: For a landmark L the triangle inequality gives dist(v, t) >= dist(L, t) - dist(L, v)
+    and dist(v, t) >= dist(v, L) - dist(t, L); the heuristic is the largest of these bounds.
+    Save the table once and load it at startup instead of running 2 * L Dijkstra passes again.
+    """
+    def __init__(self, landmarks: List[int], from_landmark: List[Dict[int, float]],
+                 to_landmark: List[Dict[int, float]]):
+        self.landmarks = landmarks
+        self.from_landmark = from_landmark
+        self.to_landmark = to_landmark
+
+    @classmethod
+    def build(cls, graph: Dict[int, List[Tuple[int, int]]], num_landmarks: int = 4,
+              landmarks: List[int] = None) -> 'LandmarkTable':
+        reversed_graph = reverse_graph(graph)
+        if landmarks is None:
+            # Farthest-point selection: each new landmark is the node farthest from all chosen so far
+            landmarks = []
+            closest = {node: float('inf') for node in reversed_graph}
+            candidate = next(iter(graph))
+            while len(landmarks) < min(num_landmarks, len(closest)):
+                landmarks.append(candidate)
+                for node, distance in dijkstra(reversed_graph, candidate).items():
+                    closest[node] = min(closest[node], distance)
+                for landmark in landmarks:
+                    closest[landmark] = -1
+                candidate = max(closest, key=closest.get)
+        from_landmark = [dijkstra(graph, landmark) for landmark in landmarks]
+        to_landmark = [dijkstra(reversed_graph, landmark) for landmark in landmarks]
+        return cls(landmarks, from_landmark, to_landmark)
+
+    def heuristic(self, node: int, target: int) -> float:
+        inf = float('inf')
+        bound = 0
+        for from_distances, to_distances in zip(self.from_landmark, self.to_landmark):
+            landmark_node, landmark_target = from_distances.get(node, inf), from_distances.get(target, inf)
+            if landmark_node != inf:
+                # The landmark reaches node but not target, so node cannot reach target
+                if landmark_target == inf:
+                    return inf
+                bound = max(bound, landmark_target - landmark_node)
+            node_landmark, target_landmark = to_distances.get(node, inf), to_distances.get(target, inf)
+            if target_landmark != inf:
+                if node_landmark == inf:
+                    return inf
+                bound = max(bound, node_landmark - target_landmark)
+        return bound
+
+    def save(self, path: str) -> None:
+        with open(path, 'wb') as file:
+            pickle.dump((self.landmarks, self.from_landmark, self.to_landmark), file)
+
+    @classmethod
+    def load(cls, path: str) -> 'LandmarkTable':
+        with open(path, 'rb') as file:
+            return cls(*pickle.load(file))
+
 # Prim's Algorithm
 def prim(graph: Dict[int, List[Tuple[int, int]]]) -> Dict[int, int]:
     """
     Prim's algorithm to find the minimum spanning tree (MST) of a connected, undirected graph.
 
     Assumption: The graph is connected and undirected.
+    CSR: A graph_csr.CSRGraph is accepted as well; the tree is then grown from vertex id 0 and keyed by its integer vertex ids.
     Type Annotation:
         graph: Dict[int, List[Tuple[int, int]]] - Weighted adjacency list representation of the graph.
     Time Complexity: O((V + E) * log(V)) where V is the number of vertices and E is the number of edges.
     Space Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
     Trick: Use priority queue (heapq) to efficiently select the next edge with the smallest weight.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.prim(graph)
+
     mst = {}
     visited = set()
     start_node = next(iter(graph))
@@ -179,12 +643,16 @@ def kruskal(graph: Dict[int, List[Tuple[int, int]]]) -> Dict[int, int]:
     Kruskal's algorithm to find the minimum spanning tree (MST) of a connected, undirected graph.
 
     Assumption: The graph is connected and undirected.
+    CSR: A graph_csr.CSRGraph is accepted as well; the tree edges are then pairs of its integer vertex ids.
     Type Annotation:
         graph: Dict[int, List[Tuple[int, int]]] - Weighted adjacency list representation of the graph.
     Time Complexity: O(E * log(E)) where E is the number of edges.
     Space Complexity: O(E) where E is the number of edges.
     Trick: Use Union-Find data structure to efficiently detect cycles while selecting edges.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.kruskal(graph)
+
     def find(parent, x):
         if parent[x] != x:
             parent[x] = find(parent, parent[x])
@@ -216,12 +684,148 @@ def kruskal(graph: Dict[int, List[Tuple[int, int]]]) -> Dict[int, int]:
 
     return mst
 
+# Boruvka's Algorithm
+_pool_sources = None
+_pool_targets = None
+_pool_weights = None
+_pool_components = None
+_pool_shared = None
+
+def _init_boruvka_worker(sources, targets, weights, name):
+    global _pool_sources, _pool_targets, _pool_weights, _pool_components, _pool_shared
+    from multiprocessing import shared_memory, util
+    _pool_sources, _pool_targets, _pool_weights = sources, targets, weights
+    _pool_shared = shared_memory.SharedMemory(name=name)
+    _pool_components = _pool_shared.buf.cast('i')
+    util.Finalize(None, _close_boruvka_worker, exitpriority=10)
+
+def _close_boruvka_worker():
+    global _pool_components, _pool_shared
+    _pool_components.release()
+    _pool_shared.close()
+    _pool_components = _pool_shared = None
+
+def _cheapest_edges(sources, targets, weights, components, start, stop):
+    # Ties on weight go to the lower edge position, so (weight, position) is a strict order and the chosen
+    # edges never close a cycle; positions are scanned in increasing order, so only a lighter edge replaces one
+    cheapest = {}
+    for position in range(start, stop):
+        component_u, component_v = components[sources[position]], components[targets[position]]
+        if component_u != component_v:
+            weight = weights[position]
+            for component in (component_u, component_v):
+                best = cheapest.get(component)
+                if best is None or weight < weights[best]:
+                    cheapest[component] = position
+    return cheapest
+
+def _cheapest_edges_chunk(task):
+    start, stop = task
+    return _cheapest_edges(_pool_sources, _pool_targets, _pool_weights, _pool_components, start, stop)
+
+def boruvka(graph: Dict[int, List[Tuple[int, int]]], processes: int = None,
+            vectorized: bool = False) -> Dict[Tuple[int, int], int]:
+    """
+    Boruvka's algorithm to find the minimum spanning forest of an undirected graph.
+
+    Assumption: The graph is undirected. It does not have to be connected - every component gets its own tree.
+    Type Annotation:
+        graph: Dict[int, List[Tuple[int, int]]] - Weighted adjacency list representation of the graph.
+        processes: int - Scan the edges in chunks on a multiprocessing.Pool of this size (None = serial).
+        vectorized: bool - Find the cheapest edges with a NumPy segment-min (np.minimum.at) instead.
+    Time Complexity: O(E * log(V)) - at most log(V) phases, each a linear scan over the edges.
+    Space Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Trick: Each phase finds the cheapest edge leaving every component and adds all of them at once, so the
+    number of components at least halves. Finding them is a map over independent edge chunks followed by a
+    per-component min, which parallelizes. Edges are compared by (weight, position), a strict order without
+    any global sort, so the chosen edges never close a cycle; UnionFind merges the components between phases.
+    The pool workers get the edges once (initializer) and read each phase's component labels from one
+    shared-memory array, so a task is only a (start, stop) range.
+    Returns: {(u, v): weight} of the forest edges.
+    """
+    nodes = list(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    sources, targets, weights = [], [], []
+    for u, neighbors in graph.items():
+        for v, weight in neighbors:
+            sources.append(index[u])
+            targets.append(index[v])
+            weights.append(weight)
+    n, m = len(nodes), len(weights)
+    uf = UnionFind(n)
+    mst = {}
+
+    pool = block = shared_components = None
+    if vectorized:
+        import numpy as np
+        sources, targets = np.array(sources, dtype=np.intp), np.array(targets, dtype=np.intp)
+        weight_array = np.array(weights)
+    elif processes is not None:
+        from array import array
+        from multiprocessing import Pool, shared_memory
+        block = shared_memory.SharedMemory(create=True, size=4 * max(1, n))
+        shared_components = block.buf.cast('i')
+        pool = Pool(processes, initializer=_init_boruvka_worker, initargs=(sources, targets, weights, block.name))
+        chunk_size = max(1, -(-m // (4 * processes)))
+        tasks = [(start, min(start + chunk_size, m)) for start in range(0, m, chunk_size)]
+
+    try:
+        while True:
+            components = [uf.find(i) for i in range(n)]
+            if vectorized:
+                components = np.array(components, dtype=np.intp)
+                component_u, component_v = components[sources], components[targets]
+                crossing = np.flatnonzero(component_u != component_v)
+                ends = np.concatenate((component_u[crossing], component_v[crossing]))
+                crossing = np.concatenate((crossing, crossing))
+                # Lexicographic (weight, position) min: lightest weight per component, then lowest position among those
+                crossing_weights = weight_array[crossing]
+                lightest = np.full(n, crossing_weights.max() if len(crossing) else 0, dtype=weight_array.dtype)
+                np.minimum.at(lightest, ends, crossing_weights)
+                tied = crossing_weights == lightest[ends]
+                cheapest = np.full(n, m, dtype=np.intp)
+                np.minimum.at(cheapest, ends[tied], crossing[tied])
+                positions = cheapest[cheapest < m].tolist()
+            elif pool is not None:
+                shared_components[:n] = array('i', components)
+                cheapest = {}
+                # imap keeps chunk order, so on equal weights the earlier chunk (lower position) wins
+                for chunk in pool.imap(_cheapest_edges_chunk, tasks):
+                    for component, position in chunk.items():
+                        best = cheapest.get(component)
+                        if best is None or weights[position] < weights[best]:
+                            cheapest[component] = position
+                positions = cheapest.values()
+            else:
+                positions = _cheapest_edges(sources, targets, weights, components, 0, m).values()
+
+            merged = False
+            for position in sorted(set(positions)):
+                u, v = int(sources[position]), int(targets[position])
+                if uf.find(u) != uf.find(v):
+                    uf.union(u, v)
+                    mst[(nodes[u], nodes[v])] = weights[position]
+                    merged = True
+            if not merged:
+                break
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        if block is not None:
+            shared_components.release()
+            block.close()
+            block.unlink()
+
+    return mst
+
 # Bellman-Ford Algorithm
 def bellman_ford(graph: Dict[int, List[Tuple[int, int]]], start: int) -> Dict[int, int]:
     """
     Bellman-Ford algorithm to find the shortest paths from a single source node to all other nodes in a graph.
 
     Assumption: The graph may contain negative edge weights but should not contain negative cycles.
+    CSR: A graph_csr.CSRGraph is accepted as well; vertices (start and results) are then its integer ids.
     Type Annotation:
         graph: Dict[int, List[Tuple[int, int]]] - Weighted adjacency list representation of the graph.
         start: int - Starting node for Bellman-Ford algorithm.
@@ -229,29 +833,98 @@ def bellman_ford(graph: Dict[int, List[Tuple[int, int]]], start: int) -> Dict[in
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Relax edges repeatedly to find the shortest paths.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.bellman_ford(graph, start)
+
     distances = {node: float('inf') for node in graph}
     distances[start] = 0
 
     for _ in range(len(graph) - 1):
+        changed = False
         for node in graph:
             for neighbor, weight in graph[node]:
                 if distances[node] + weight < distances[neighbor]:
                     distances[neighbor] = distances[node] + weight
+                    changed = True
+        if not changed:
+            break
 
     return distances
 
+# Queue-based Bellman-Ford (SPFA) Algorithm
+def _parent_cycle(parents, node):
+    # Follow parent links from node; a repeated node closes a cycle, None means there is none on this chain
+    position = {}
+    chain = []
+    while node is not None and node not in position:
+        position[node] = len(chain)
+        chain.append(node)
+        node = parents[node]
+    if node is None:
+        return []
+    return chain[position[node]:][::-1]
+
+def spfa(graph: Dict[int, List[Tuple[int, int]]], start: int = None) -> Tuple[Dict[int, float], List[int]]:
+    """
+    Queue-based Bellman-Ford (Shortest Path Faster Algorithm) that also finds a negative cycle.
+
+    Assumption: The graph may contain negative edge weights and negative cycles.
+    Type Annotation:
+        graph: Dict[int, List[Tuple[int, int]]] - Weighted adjacency list representation of the graph.
+        start: int - Starting node, or None to start from every node at distance 0 (finds a negative cycle anywhere,
+        e.g. for arbitrage detection with weights -log(rate)).
+    Time Complexity: O(V * E) worst case, close to O(E) on most graphs.
+    Space Complexity: O(V) where V is the number of vertices.
+    Trick: Only nodes whose distance changed are queued, so edges out of settled nodes are never relaxed again and
+    the search stops as soon as the queue is empty. A node whose shortest path uses V edges lies behind a negative
+    cycle, and following parent links back from it runs into that cycle.
+    Returns: (distances, cycle) - cycle lists the nodes of a negative cycle in edge order (the last node has an edge
+    back to the first), or [] when there is none. Distances are not final when a cycle is returned.
+    """
+    sources = list(graph) if start is None else [start]
+    distances = {node: float('inf') for node in graph}
+    parents = {node: None for node in graph}
+    edge_count = {node: 0 for node in graph}
+    for node in sources:
+        distances[node] = 0
+    queue = deque(sources)
+    queued = set(sources)
+
+    while queue:
+        node = queue.popleft()
+        queued.discard(node)
+        for neighbor, weight in graph[node]:
+            if distances[node] + weight < distances[neighbor]:
+                distances[neighbor] = distances[node] + weight
+                parents[neighbor] = node
+                edge_count[neighbor] = edge_count[node] + 1
+                if edge_count[neighbor] >= len(graph):
+                    cycle = _parent_cycle(parents, neighbor)
+                    if cycle:
+                        return distances, cycle
+                if neighbor not in queued:
+                    queued.add(neighbor)
+                    queue.append(neighbor)
+
+    return distances, []
+
 # Floyd-Warshall Algorithm
-def floyd_warshall(graph: Dict[int, Dict[int, int]]) -> Dict[int, Dict[int, int]]:
+def floyd_warshall(graph: Dict[int, Dict[int, int]], vectorized: bool = False) -> Dict[int, Dict[int, int]]:
     """
     Floyd-Warshall algorithm to find all pair shortest paths in a weighted graph.
 
     Assumption: The graph may contain negative edge weights but should not contain negative cycles.
+    CSR: A graph_csr.CSRGraph is accepted as well; the result is then one distance array per vertex id.
     Type Annotation:
         graph: Dict[int, Dict[int, int]] - Weighted adjacency list representation of the graph.
+        vectorized: bool - Run the k-steps with NumPy (graph_floyd_warshall_numpy) instead of three Python loops.
     Time Complexity: O(V^3) where V is the number of vertices.
     Space Complexity: O(V^2) where V is the number of vertices.
-    Trick: Dynamic Programming approach to solve all pair shortest paths.
+    Trick: Dynamic Programming approach to solve all pair shortest paths. For sparse graphs use johnson instead.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.floyd_warshall(graph)
+
     n = len(graph)
     distances = [[float('inf')] * n for _ in range(n)]
 
@@ -260,6 +933,10 @@ def floyd_warshall(graph: Dict[int, Dict[int, int]]) -> Dict[int, Dict[int, int]
         for neighbor, weight in graph[i].items():
             distances[i][neighbor] = weight
 
+    if vectorized:
+        from graph_floyd_warshall_numpy import floyd_warshall_numpy
+        return floyd_warshall_numpy(distances).tolist()
+
     for k in range(n):
         for i in range(n):
             for j in range(n):
@@ -267,18 +944,77 @@ def floyd_warshall(graph: Dict[int, Dict[int, int]]) -> Dict[int, Dict[int, int]
 
     return distances
 
+# Johnson's Algorithm
+_pool_graph = None
+_pool_potentials = None
+
+def _init_johnson_worker(graph, potentials):
+    global _pool_graph, _pool_potentials
+    _pool_graph, _pool_potentials = graph, potentials
+
+def _johnson_row(source):
+    return source, _unweight_row(_pool_graph, _pool_potentials, source)
+
+def _unweight_row(graph, potentials, source):
+    return {node: distance - potentials[source] + potentials[node]
+            for node, distance in dijkstra(graph, source).items() if distance != float('inf')}
+
+def johnson(graph: Dict[int, List[Tuple[int, int]]], processes: int = None) -> Dict[int, Dict[int, int]]:
+    """
+    Johnson's algorithm to find all pair shortest paths in a sparse weighted graph.
+
+    Assumption: The graph may contain negative edge weights but should not contain negative cycles.
+    CSR: A graph_csr.CSRGraph is accepted as well; the result is then one distance array per vertex id.
+    Type Annotation:
+        graph: Dict[int, List[Tuple[int, int]]] - Weighted adjacency list representation of the graph.
+        processes: int - Run the per-source dijkstra passes on a multiprocessing.Pool of this size (None = serial).
+    Time Complexity: O(V * E + V * (V + E) * log(V)) - beats floyd_warshall's O(V^3) when E is much smaller than V^2.
+    Space Complexity: O(V^2) for the result, O(V + E) for the reweighted graph.
+    Trick: Run bellman_ford once from an extra node with a 0-weight edge to every node. Its distances h make every
+    edge weight w(u, v) + h[u] - h[v] non-negative, so dijkstra can run from each node and the result is shifted back.
+    Raises: ValueError when the graph contains a negative cycle.
+    Returns: distances[u][v] for every v reachable from u.
+    """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.johnson(graph, processes)
+
+    source = object()
+    augmented = dict(graph)
+    augmented[source] = [(node, 0) for node in graph]
+    potentials = bellman_ford(augmented, source)
+
+    reweighted = {}
+    for node, neighbors in graph.items():
+        reweighted[node] = []
+        for neighbor, weight in neighbors:
+            weight += potentials[node] - potentials[neighbor]
+            if weight < 0:
+                raise ValueError("Graph contains a negative cycle")
+            reweighted[node].append((neighbor, weight))
+
+    if processes is None:
+        return {node: _unweight_row(reweighted, potentials, node) for node in graph}
+
+    from multiprocessing import Pool
+    with Pool(processes, initializer=_init_johnson_worker, initargs=(reweighted, potentials)) as pool:
+        return dict(pool.imap_unordered(_johnson_row, graph, chunksize=max(1, len(graph) // (4 * processes))))
+
 # Cycle Detection in Undirected Graph (Using DFS)
 def has_cycle(graph: Dict[int, List[int]]) -> bool:
     """
     Cycle detection algorithm to detect cycles in an undirected graph.
 
     Assumption: The graph is undirected.
+    CSR: A graph_csr.CSRGraph is accepted as well (both directions of every edge stored).
     Type Annotation:
         graph: Dict[int, List[int]] - Adjacency list representation of the graph.
     Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Use DFS to detect back edges while traversing the graph.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.has_cycle(graph)
+
     def dfs(node, parent):
         visited.add(node)
         for neighbor in graph[node]:
@@ -302,43 +1038,43 @@ def find_cut_vertices(graph: Dict[int, List[int]]) -> Set[int]:
     Cut vertex (articulation point) detection algorithm to find the vertices whose removal would increase the number of connected components.
 
     Assumption: The graph is undirected.
+    CSR: A graph_csr.CSRGraph is accepted as well; vertices (results) are then its integer ids.
     Type Annotation:
         graph: Dict[int, List[int]] - Adjacency list representation of the graph.
     Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
-    Space Complexity: O(V) where V is the number of vertices.
-    Trick: Use DFS to detect articulation points.
+    Space Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Trick: Use DFS to detect articulation points. The DFS runs on an explicit stack (graph_csr.biconnected_components),
+    so deep graphs do not hit the recursion limit.
     """
-    def dfs(node, parent, visited, disc, low, result):
-        children = 0
-        visited.add(node)
-        disc[node] = time[0]
-        low[node] = time[0]
-        time[0] += 1
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.biconnected_components(graph)[0]
 
-        for neighbor in graph[node]:
-            if neighbor not in visited:
-                children += 1
-                dfs(neighbor, node, visited, disc, low, result)
-                low[node] = min(low[node], low[neighbor])
-
-                if parent is None and children > 1:
-                    result.add(node)
-                elif parent is not None and low[neighbor] >= disc[node]:
-                    result.add(node)
-            elif neighbor != parent:
-                low[node] = min(low[node], disc[neighbor])
+    csr = graph_csr.CSRGraph.from_adjacency_list(graph, weighted=False)
+    return {csr.vertex_label(v) for v in graph_csr.biconnected_components(csr)[0]}
 
-    visited = set()
-    disc = {}
-    low = {}
-    result = set()
-    time = [0]
+# Bridges and Biconnected Components
+def biconnected_components(graph: Dict[int, List[int]]) -> Tuple[Set[int], List[Tuple[int, int]], List[List[Tuple[int, int]]]]:
+    """
+    Cut vertices, bridges and biconnected components of an undirected graph in a single DFS pass.
 
-    for node in graph:
-        if node not in visited:
-            dfs(node, None, visited, disc, low, result)
+    Assumption: The graph is undirected.
+    CSR: A graph_csr.CSRGraph is accepted as well; vertices (results) are then its integer ids.
+    Type Annotation:
+        graph: Dict[int, List[int]] - Adjacency list representation of the graph.
+    Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Space Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Trick: One low-link DFS on an explicit stack finds all three; the edges of a component are popped off an
+    edge stack whenever a child cannot reach above its parent.
+    Returns: (cut_vertices, bridges, components) - every component as its list of edges.
+    """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.biconnected_components(graph)
 
-    return result
+    csr = graph_csr.CSRGraph.from_adjacency_list(graph, weighted=False)
+    label = csr.vertex_label
+    cut_vertices, bridges, components = graph_csr.biconnected_components(csr)
+    return ({label(v) for v in cut_vertices}, [(label(u), label(v)) for u, v in bridges],
+            [[(label(u), label(v)) for u, v in component] for component in components])
 
 # Example usage:
 
@@ -357,9 +1093,23 @@ print("DFS traversal:", dfs(graph_adj_list, 0))
 # BFS example usage
 print("BFS traversal:", bfs(graph_adj_list, 0))
 
+# Direction-Optimizing BFS example usage
+print("BFS depth and parent:", direction_optimizing_bfs(graph_adj_list, 0))
+
 # Topological Sort example usage
 print("Topological Sort:", topological_sort(graph_adj_list))
 
+# Strongly Connected Components example usage
+directed_graph = {0: [1], 1: [2], 2: [0, 3], 3: [4], 4: [3]}
+print("Strongly connected components:", strongly_connected_components(directed_graph))
+dag, component = condensation(directed_graph)
+print("Condensation:", dag, component, "topological order:", topological_sort(dag))
+
+# Dynamic Topological Order example usage
+dynamic_order = DynamicTopologicalOrder({0: [1], 1: [2], 2: [], 3: []})
+dynamic_order.add_edge(3, 0)
+print("Dynamic topological order:", dynamic_order.order())
+
 # Dijkstra's Algorithm example usage
 weighted_graph = {
     0: [(1, 4), (2, 3)],
@@ -369,12 +1119,26 @@ weighted_graph = {
 }
 print("Dijkstra's shortest paths:", dijkstra(weighted_graph, 0))
 
+# Multi-source and batched Dijkstra example usage
+print("Nearest source:", multi_source_dijkstra(weighted_graph, [1, 2]))
+print("Dijkstra from many sources:", dijkstra_many(weighted_graph, [0, 2]))
+
+# Bidirectional Dijkstra's Algorithm example usage
+print("Bidirectional Dijkstra 0 -> 3:", bidirectional_dijkstra(weighted_graph, 0, 3))
+
+# A* / ALT example usage
+landmark_table = LandmarkTable.build(weighted_graph, num_landmarks=2)
+print("A* (ALT) 0 -> 3:", astar(weighted_graph, 0, 3, landmark_table.heuristic))
+
 # Prim's Algorithm example usage
 print("Prim's Minimum Spanning Tree:", prim(weighted_graph))
 
 # Kruskal's Algorithm example usage
 print("Kruskal's Minimum Spanning Tree:", kruskal(weighted_graph))
 
+# Boruvka's Algorithm example usage
+print("Boruvka's Minimum Spanning Forest:", boruvka(weighted_graph))
+
 # Bellman-Ford Algorithm example usage
 weighted_graph_negative = {
     0: [(1, 4), (2, 3)],
@@ -383,6 +1147,8 @@ weighted_graph_negative = {
     3: []
 }
 print("Bellman-Ford shortest paths:", bellman_ford(weighted_graph_negative, 0))
+print("SPFA shortest paths and negative cycle:", spfa(weighted_graph_negative, 0))
+print("SPFA negative cycle:", spfa({0: [(1, 1)], 1: [(2, -3)], 2: [(0, 1)]})[1])
 
 # Floyd-Warshall Algorithm example usage
 weighted_graph_all_pairs = {
@@ -392,9 +1158,18 @@ weighted_graph_all_pairs = {
     3: {}
 }
 print("Floyd-Warshall all pair shortest paths:", floyd_warshall(weighted_graph_all_pairs))
+print("Floyd-Warshall all pair shortest paths (NumPy):", floyd_warshall(weighted_graph_all_pairs, vectorized=True))
+
+# Johnson's Algorithm example usage
+print("Johnson all pair shortest paths:", johnson(weighted_graph_negative))
 
 # Cycle Detection example usage
 print("Graph has cycle:", has_cycle(graph_adj_list))
 
 # Cut Vertex Detection example usage
 print("Cut vertices:", find_cut_vertices(graph_adj_list))
+print("Cut vertices, bridges and biconnected components:", biconnected_components(graph_adj_list))
+
+# CSR example usage
+csr_graph = graph_csr.CSRGraph.from_adjacency_list(weighted_graph)
+print("Dijkstra's shortest paths (CSR):", list(dijkstra(csr_graph, 0)))
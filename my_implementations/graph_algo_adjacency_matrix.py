@@ -1,12 +1,15 @@
 import heapq
 from typing import List, Dict, Set, Tuple
 
+import graph_csr
+
 # Depth First Search (DFS) Algorithm
 def dfs(graph: List[List[int]], start: int) -> List[int]:
     """
     DFS algorithm to traverse a graph starting from a given node.
 
     Assumption: The graph is represented using an adjacency matrix.
+    CSR: A graph_csr.CSRGraph is accepted as well; vertices (start and results) are then its integer ids.
     Type Annotation:
         graph: List[List[int]] - Adjacency matrix representation of the graph.
         start: int - Starting node for DFS traversal.
@@ -14,6 +17,9 @@ def dfs(graph: List[List[int]], start: int) -> List[int]:
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Use a stack (or recursion) to keep track of nodes to visit.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.dfs(graph, start)
+
     visited = set()
     traversal_order = []
 
@@ -33,6 +39,7 @@ def bfs(graph: List[List[int]], start: int) -> List[int]:
     BFS algorithm to traverse a graph starting from a given node.
 
     Assumption: The graph is represented using an adjacency matrix.
+    CSR: A graph_csr.CSRGraph is accepted as well; vertices (start and results) are then its integer ids.
     Type Annotation:
         graph: List[List[int]] - Adjacency matrix representation of the graph.
         start: int - Starting node for BFS traversal.
@@ -40,6 +47,9 @@ def bfs(graph: List[List[int]], start: int) -> List[int]:
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Use a queue to keep track of nodes to visit.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.bfs(graph, start)
+
     visited = set()
     traversal_order = []
     queue = [start]
@@ -96,12 +106,16 @@ def topological_sort(graph: List[List[int]]) -> List[int]:
     Topological sort algorithm to find the linear ordering of vertices in a directed acyclic graph (DAG).
 
     Assumption: The graph is a directed acyclic graph (DAG).
+    CSR: A graph_csr.CSRGraph is accepted as well; the order is then over its integer vertex ids.
     Type Annotation:
         graph: List[List[int]] - Adjacency matrix representation of the graph.
     Time Complexity: O(V^2) where V is the number of vertices.
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Use DFS and stack to order the vertices.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.topological_sort(graph)
+
     visited = set()
     stack = []
 
@@ -124,6 +138,7 @@ def dijkstra(graph: List[List[int]], start: int) -> List[int]:
     Dijkstra's algorithm to find the shortest paths from a single source node to all other nodes in a graph.
 
     Assumption: The graph is weighted and does not contain negative edge weights.
+    CSR: A graph_csr.CSRGraph is accepted as well; vertices (start and results) are then its integer ids.
     Type Annotation:
         graph: List[List[int]] - Weighted adjacency matrix representation of the graph.
         start: int - Starting node for Dijkstra's algorithm.
@@ -131,6 +146,9 @@ def dijkstra(graph: List[List[int]], start: int) -> List[int]:
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Use priority queue (heapq) to efficiently select the next vertex with the smallest distance.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.dijkstra(graph, start)
+
     n = len(graph)
     distances = [float('inf')] * n
     distances[start] = 0
@@ -153,12 +171,16 @@ def prim(graph: List[List[int]]) -> Dict[int, int]:
     Prim's algorithm to find the minimum spanning tree (MST) of a connected, undirected graph.
 
     Assumption: The graph is connected and undirected.
+    CSR: A graph_csr.CSRGraph is accepted as well; the tree is then grown from vertex id 0 and keyed by its integer vertex ids.
     Type Annotation:
         graph: List[List[int]] - Weighted adjacency matrix representation of the graph.
     Time Complexity: O(V^2) where V is the number of vertices.
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Use priority queue (heapq) to efficiently select the next edge with the smallest weight.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.prim(graph)
+
     n = len(graph)
     mst = {}
     visited = set()
@@ -183,12 +205,16 @@ def kruskal(graph: List[List[int]]) -> Dict[int, int]:
     Kruskal's algorithm to find the minimum spanning tree (MST) of a connected, undirected graph.
 
     Assumption: The graph is connected and undirected.
+    CSR: A graph_csr.CSRGraph is accepted as well; the tree edges are then pairs of its integer vertex ids.
     Type Annotation:
         graph: List[List[int]] - Weighted adjacency matrix representation of the graph.
     Time Complexity: O(V^2) where V is the number of vertices.
     Space Complexity: O(V^2) where V is the number of vertices.
     Trick: Use Union-Find data structure to efficiently detect cycles while selecting edges.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.kruskal(graph)
+
     n = len(graph)
     mst = {}
     edges = []
@@ -212,6 +238,7 @@ def bellman_ford(graph: List[List[int]], start: int) -> List[int]:
     Bellman-Ford algorithm to find the shortest paths from a single source node to all other nodes in a graph.
 
     Assumption: The graph may contain negative edge weights but should not contain negative cycles.
+    CSR: A graph_csr.CSRGraph is accepted as well; vertices (start and results) are then its integer ids.
     Type Annotation:
         graph: List[List[int]] - Weighted adjacency matrix representation of the graph.
         start: int - Starting node for Bellman-Ford algorithm.
@@ -219,6 +246,9 @@ def bellman_ford(graph: List[List[int]], start: int) -> List[int]:
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Relax edges repeatedly to find the shortest paths.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.bellman_ford(graph, start)
+
     n = len(graph)
     distances = [float('inf')] * n
     distances[start] = 0
@@ -237,12 +267,16 @@ def floyd_warshall(graph: List[List[int]]) -> List[List[int]]:
     Floyd-Warshall algorithm to find all pair shortest paths in a weighted graph.
 
     Assumption: The graph may contain negative edge weights but should not contain negative cycles.
+    CSR: A graph_csr.CSRGraph is accepted as well; the result is then one distance array per vertex id.
     Type Annotation:
         graph: List[List[int]] - Weighted adjacency matrix representation of the graph.
     Time Complexity: O(V^3) where V is the number of vertices.
     Space Complexity: O(V^2) where V is the number of vertices.
     Trick: Dynamic Programming approach to solve all pair shortest paths.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.floyd_warshall(graph)
+
     n = len(graph)
     distances = [[float('inf')] * n for _ in range(n)]
 
@@ -263,12 +297,16 @@ def has_cycle(graph: List[List[int]]) -> bool:
     Cycle detection algorithm to detect cycles in an undirected graph.
 
     Assumption: The graph is undirected.
+    CSR: A graph_csr.CSRGraph is accepted as well (both directions of every edge stored).
     Type Annotation:
         graph: List[List[int]] - Adjacency matrix representation of the graph.
     Time Complexity: O(V^2) where V is the number of vertices.
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Use DFS to detect back edges while traversing the graph.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.has_cycle(graph)
+
     def dfs(node, parent):
         visited.add(node)
         for neighbor, connected in enumerate(graph[node]):
@@ -293,44 +331,19 @@ def find_cut_vertices(graph: List[List[int]]) -> Set[int]:
     Cut vertex (articulation point) detection algorithm to find the vertices whose removal would increase the number of connected components.
 
     Assumption: The graph is undirected.
+    CSR: A graph_csr.CSRGraph is accepted as well; vertices (results) are then its integer ids.
     Type Annotation:
         graph: List[List[int]] - Adjacency matrix representation of the graph.
     Time Complexity: O(V^2) where V is the number of vertices.
-    Space Complexity: O(V) where V is the number of vertices.
-    Trick: Use DFS to detect articulation points.
+    Space Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Trick: Use DFS to detect articulation points. The DFS runs on an explicit stack (graph_csr.biconnected_components),
+    so deep graphs do not hit the recursion limit.
     """
-    def dfs(node, parent, visited, disc, low, result):
-        children = 0
-        visited.add(node)
-        disc[node] = time[0]
-        low[node] = time[0]
-        time[0] += 1
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.biconnected_components(graph)[0]
 
-        for neighbor, connected in enumerate(graph[node]):
-            if connected:
-                if neighbor not in visited:
-                    children += 1
-                    dfs(neighbor, node, visited, disc, low, result)
-                    low[node] = min(low[node], low[neighbor])
-
-                    if parent is None and children > 1:
-                        result.add(node)
-                    elif parent is not None and low[neighbor] >= disc[node]:
-                        result.add(node)
-                elif neighbor != parent:
-                    low[node] = min(low[node], disc[neighbor])
-
-    visited = set()
-    disc = {}
-    low = {}
-    result = set()
-    time = [0]
-
-    for node in range(len(graph)):
-        if node not in visited:
-            dfs(node, None, visited, disc, low, result)
-
-    return result
+    csr = graph_csr.CSRGraph.from_adjacency_matrix(graph)
+    return {csr.vertex_label(v) for v in graph_csr.biconnected_components(csr)[0]}
 
 # Example usage:
 
@@ -393,3 +406,7 @@ print("Graph has cycle:", has_cycle(graph_adj_matrix))
 
 # Cut Vertex Detection example usage
 print("Cut vertices:", find_cut_vertices(graph_adj_matrix))
+
+# CSR example usage
+csr_graph = graph_csr.CSRGraph.from_adjacency_matrix(weighted_graph_matrix)
+print("Dijkstra's shortest paths (CSR):", list(dijkstra(csr_graph, 0)))
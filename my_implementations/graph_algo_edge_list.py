@@ -1,12 +1,16 @@
+from collections import defaultdict, deque
 import heapq
 from typing import List, Dict, Set, Tuple
 
+import graph_csr
+
 # Depth First Search (DFS) Algorithm
 def dfs(graph: List[Tuple[int, int]], start: int) -> List[int]:
     """
     DFS algorithm to traverse a graph starting from a given node.
 
     Assumption: The graph is represented using an edge list.
+    CSR: A graph_csr.CSRGraph is accepted as well; vertices (start and results) are then its integer ids.
     Type Annotation:
         graph: List[Tuple[int, int]] - Edge list representation of the graph.
         start: int - Starting node for DFS traversal.
@@ -14,6 +18,9 @@ def dfs(graph: List[Tuple[int, int]], start: int) -> List[int]:
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Use a stack (or recursion) to keep track of nodes to visit.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.dfs(graph, start)
+
     adj_list = defaultdict(list)
     for u, v in graph:
         adj_list[u].append(v)
@@ -38,6 +45,7 @@ def bfs(graph: List[Tuple[int, int]], start: int) -> List[int]:
     BFS algorithm to traverse a graph starting from a given node.
 
     Assumption: The graph is represented using an edge list.
+    CSR: A graph_csr.CSRGraph is accepted as well; vertices (start and results) are then its integer ids.
     Type Annotation:
         graph: List[Tuple[int, int]] - Edge list representation of the graph.
         start: int - Starting node for BFS traversal.
@@ -45,6 +53,9 @@ def bfs(graph: List[Tuple[int, int]], start: int) -> List[int]:
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Use a queue to keep track of nodes to visit.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.bfs(graph, start)
+
     adj_list = defaultdict(list)
     for u, v in graph:
         adj_list[u].append(v)
@@ -104,12 +115,16 @@ def topological_sort(graph: List[Tuple[int, int]]) -> List[int]:
     Topological sort algorithm to find the linear ordering of vertices in a directed acyclic graph (DAG).
 
     Assumption: The graph is a directed acyclic graph (DAG).
+    CSR: A graph_csr.CSRGraph is accepted as well; the order is then over its integer vertex ids.
     Type Annotation:
         graph: List[Tuple[int, int]] - Edge list representation of the graph.
     Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Use DFS and stack to order the vertices.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.topological_sort(graph)
+
     adj_list = defaultdict(list)
     for u, v in graph:
         adj_list[u].append(v)
@@ -124,7 +139,8 @@ def topological_sort(graph: List[Tuple[int, int]]) -> List[int]:
                 dfs(neighbor)
         stack.append(node)
 
-    for node in adj_list:
+    # list() because visiting a sink adds it to the defaultdict
+    for node in list(adj_list):
         if node not in visited:
             dfs(node)
 
@@ -136,6 +152,7 @@ def dijkstra(graph: List[Tuple[int, int, int]], start: int) -> Dict[int, int]:
     Dijkstra's algorithm to find the shortest paths from a single source node to all other nodes in a graph.
 
     Assumption: The graph is weighted and does not contain negative edge weights.
+    CSR: A graph_csr.CSRGraph is accepted as well; vertices (start and results) are then its integer ids.
     Type Annotation:
         graph: List[Tuple[int, int, int]] - Weighted edge list representation of the graph.
         start: int - Starting node for Dijkstra's algorithm.
@@ -143,6 +160,9 @@ def dijkstra(graph: List[Tuple[int, int, int]], start: int) -> Dict[int, int]:
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Use priority queue (heapq) to efficiently select the next vertex with the smallest distance.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.dijkstra(graph, start)
+
     adj_list = defaultdict(list)
     for u, v, weight in graph:
         adj_list[u].append((v, weight))
@@ -168,12 +188,16 @@ def prim(graph: List[Tuple[int, int, int]]) -> Dict[int, int]:
     Prim's algorithm to find the minimum spanning tree (MST) of a connected, undirected graph.
 
     Assumption: The graph is connected and undirected.
+    CSR: A graph_csr.CSRGraph is accepted as well; the tree is then grown from vertex id 0 and keyed by its integer vertex ids.
     Type Annotation:
         graph: List[Tuple[int, int, int]] - Weighted edge list representation of the graph.
     Time Complexity: O((V + E) * log(V)) where V is the number of vertices and E is the number of edges.
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Use priority queue (heapq) to efficiently select the next edge with the smallest weight.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.prim(graph)
+
     adj_list = defaultdict(list)
     for u, v, weight in graph:
         adj_list[u].append((v, weight))
@@ -202,12 +226,16 @@ def kruskal(graph: List[Tuple[int, int, int]]) -> Dict[int, int]:
     Kruskal's algorithm to find the minimum spanning tree (MST) of a connected, undirected graph.
 
     Assumption: The graph is connected and undirected.
+    CSR: A graph_csr.CSRGraph is accepted as well; the tree edges are then pairs of its integer vertex ids.
     Type Annotation:
         graph: List[Tuple[int, int, int]] - Weighted edge list representation of the graph.
     Time Complexity: O(E * log(E)) where E is the number of edges.
     Space Complexity: O(E) where E is the number of edges.
     Trick: Use Union-Find data structure to efficiently detect cycles while selecting edges.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.kruskal(graph)
+
     mst = {}
     edges = sorted(graph, key=lambda x: x[2])
     uf = UnionFind(len(edges))
@@ -220,21 +248,38 @@ def kruskal(graph: List[Tuple[int, int, int]]) -> Dict[int, int]:
     return mst
 
 # Bellman-Ford Algorithm
-def bellman_ford(graph: List[Tuple[int, int, int]], start: int) -> Dict[int, int]:
+def bellman_ford(graph: List[Tuple[int, int, int]], start: int, vectorized: bool = False) -> Dict[int, int]:
     """
     Bellman-Ford algorithm to find the shortest paths from a single source node to all other nodes in a graph.
 
     Assumption: The graph may contain negative edge weights but should not contain negative cycles.
+    CSR: A graph_csr.CSRGraph is accepted as well; vertices (start and results) are then its integer ids.
     Type Annotation:
         graph: List[Tuple[int, int, int]] - Weighted edge list representation of the graph.
         start: int - Starting node for Bellman-Ford algorithm.
+        vectorized: bool - Run each round as NumPy gather + scatter-minimum (graph_bellman_ford_numpy) until nothing changes.
     Time Complexity: O(V * E) where V is the number of vertices and E is the number of edges.
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Relax edges repeatedly to find the shortest paths.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.bellman_ford(graph, start)
+
     distances = defaultdict(lambda: float('inf'))
     distances[start] = 0
 
+    if vectorized:
+        import numpy as np
+        from graph_bellman_ford_numpy import bellman_ford_numpy, edge_arrays
+        sources, targets, weights = edge_arrays(graph)
+        result = bellman_ford_numpy(sources, targets, weights, start)
+        # Same keys, order and number type as the loop below would produce
+        as_int = np.issubdtype(weights.dtype, np.integer)
+        for node in (start, *(node for edge in zip(sources.tolist(), targets.tolist()) for node in edge)):
+            distance = result[node].item()
+            distances[node] = int(distance) if as_int and distance != float('inf') else distance
+        return distances
+
     for _ in range(len(graph) - 1):
         for u, v, weight in graph:
             if distances[u] + weight < distances[v]:
@@ -248,20 +293,27 @@ def floyd_warshall(graph: List[Tuple[int, int, int]]) -> Dict[Tuple[int, int], i
     Floyd-Warshall algorithm to find all pair shortest paths in a weighted graph.
 
     Assumption: The graph may contain negative edge weights but should not contain negative cycles.
+    CSR: A graph_csr.CSRGraph is accepted as well; the result is then one distance array per vertex id.
     Type Annotation:
         graph: List[Tuple[int, int, int]] - Weighted edge list representation of the graph.
     Time Complexity: O(V^3) where V is the number of vertices.
     Space Complexity: O(V^2) where V is the number of vertices.
     Trick: Dynamic Programming approach to solve all pair shortest paths.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.floyd_warshall(graph)
+
     distances = defaultdict(lambda: float('inf'))
 
+    vertices = set()
     for u, v, weight in graph:
         distances[(u, v)] = weight
+        vertices.update((u, v))
 
-    for k in range(len(distances)):
-        for i in range(len(distances)):
-            for j in range(len(distances)):
+    # Loop over the vertices, not len(distances) - the defaultdict grows on every lookup
+    for k in vertices:
+        for i in vertices:
+            for j in vertices:
                 distances[(i, j)] = min(distances[(i, j)], distances[(i, k)] + distances[(k, j)])
 
     return distances
@@ -272,12 +324,16 @@ def has_cycle(graph: List[Tuple[int, int]]) -> bool:
     Cycle detection algorithm to detect cycles in an undirected graph.
 
     Assumption: The graph is undirected.
+    CSR: A graph_csr.CSRGraph is accepted as well (both directions of every edge stored).
     Type Annotation:
         graph: List[Tuple[int, int]] - Edge list representation of the graph.
     Time Complexity: O(E * log(V)) where V is the number of vertices and E is the number of edges.
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Use Union-Find data structure to detect cycles.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.has_cycle(graph)
+
     uf = UnionFind(len(graph))
     for u, v in graph:
         if uf.find(u) == uf.find(v):
@@ -291,49 +347,19 @@ def find_cut_vertices(graph: List[Tuple[int, int]]) -> Set[int]:
     Cut vertex (articulation point) detection algorithm to find the vertices whose removal would increase the number of connected components.
 
     Assumption: The graph is undirected.
+    CSR: A graph_csr.CSRGraph is accepted as well; vertices (results) are then its integer ids.
     Type Annotation:
         graph: List[Tuple[int, int]] - Edge list representation of the graph.
     Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
-    Space Complexity: O(V) where V is the number of vertices.
-    Trick: Use DFS to detect articulation points.
+    Space Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Trick: Use DFS to detect articulation points. The DFS runs on an explicit stack (graph_csr.biconnected_components),
+    so deep graphs do not hit the recursion limit.
     """
-    def dfs(node, parent, visited, disc, low, result):
-        children = 0
-        visited.add(node)
-        disc[node] = time[0]
-        low[node] = time[0]
-        time[0] += 1
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.biconnected_components(graph)[0]
 
-        for neighbor in adj_list[node]:
-            if neighbor != parent:
-                if neighbor not in visited:
-                    children += 1
-                    dfs(neighbor, node, visited, disc, low, result)
-                    low[node] = min(low[node], low[neighbor])
-
-                    if parent is None and children > 1:
-                        result.add(node)
-                    elif parent is not None and low[neighbor] >= disc[node]:
-                        result.add(node)
-                else:
-                    low[node] = min(low[node], disc[neighbor])
-
-    adj_list = defaultdict(list)
-    for u, v in graph:
-        adj_list[u].append(v)
-        adj_list[v].append(u)
-
-    visited = set()
-    disc = {}
-    low = {}
-    result = set()
-    time = [0]
-
-    for node in adj_list:
-        if node not in visited:
-            dfs(node, None, visited, disc, low, result)
-
-    return result
+    csr = graph_csr.CSRGraph.from_edge_list(graph, directed=False)
+    return {csr.vertex_label(v) for v in graph_csr.biconnected_components(csr)[0]}
 
 # Example usage:
 
@@ -368,6 +394,7 @@ weighted_graph_edge_list_negative = [
     (0, 1, 4), (0, 2, 3), (1, 3, -2), (2, 1, 1), (2, 3, 5)
 ]
 print("Bellman-Ford shortest paths:", bellman_ford(weighted_graph_edge_list_negative, 0))
+print("Bellman-Ford shortest paths (NumPy):", bellman_ford(weighted_graph_edge_list_negative, 0, vectorized=True))
 
 # Floyd-Warshall Algorithm example usage
 weighted_graph_edge_list_all_pairs = [
@@ -380,3 +407,8 @@ print("Graph has cycle:", has_cycle(graph_edge_list))
 
 # Cut Vertex Detection example usage
 print("Cut vertices:", find_cut_vertices(graph_edge_list))
+
+# CSR example usage
+csr_graph = graph_csr.CSRGraph.from_edge_list(weighted_graph_edge_list)
+print("Dijkstra's shortest paths (CSR):", list(dijkstra(csr_graph, 0)))
+print("Topological Sort (CSR):", topological_sort(csr_graph))
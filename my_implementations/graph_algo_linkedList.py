@@ -1,6 +1,9 @@
 from collections import defaultdict, deque
+from functools import singledispatch
 import heapq
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Tuple
+
+import graph_csr
 
 class Node:
     def __init__(self, val: int):
@@ -8,11 +11,13 @@ class Node:
         self.neighbors = []
 
 # Depth First Search (DFS) Algorithm
+@singledispatch
 def dfs(node: Node) -> List[int]:
     """
     DFS algorithm to traverse a graph starting from a given node.
 
     Assumption: The graph is represented using a linked list with single references to neighbors.
+    CSR: Call dfs(csr_graph, start) with a graph_csr.CSRGraph and a starting vertex id; results are then integer ids.
     Type Annotation:
         node: Node - Starting node for DFS traversal.
     Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
@@ -34,12 +39,18 @@ def dfs(node: Node) -> List[int]:
 
     return traversal_order
 
+@dfs.register
+def _dfs_csr(graph: graph_csr.CSRGraph, start: int) -> List[int]:
+    return graph_csr.dfs(graph, start)
+
 # Breadth First Search (BFS) Algorithm
+@singledispatch
 def bfs(node: Node) -> List[int]:
     """
     BFS algorithm to traverse a graph starting from a given node.
 
     Assumption: The graph is represented using a linked list with single references to neighbors.
+    CSR: Call bfs(csr_graph, start) with a graph_csr.CSRGraph and a starting vertex id; results are then integer ids.
     Type Annotation:
         node: Node - Starting node for BFS traversal.
     Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
@@ -61,6 +72,10 @@ def bfs(node: Node) -> List[int]:
 
     return traversal_order
 
+@bfs.register
+def _bfs_csr(graph: graph_csr.CSRGraph, start: int) -> List[int]:
+    return graph_csr.bfs(graph, start)
+
 # Union Find Algorithm (Disjoint Set Union)
 class UnionFind:
     """
@@ -102,12 +117,16 @@ def topological_sort(node: Node) -> List[int]:
     Topological sort algorithm to find the linear ordering of vertices in a directed acyclic graph (DAG).
 
     Assumption: The graph is a directed acyclic graph (DAG).
+    CSR: A graph_csr.CSRGraph is accepted as well; the order is then over its integer vertex ids.
     Type Annotation:
         node: Node - Starting node for topological sort.
     Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Use DFS and stack to order the vertices.
     """
+    if isinstance(node, graph_csr.CSRGraph):
+        return graph_csr.topological_sort(node)
+
     visited = set()
     stack = []
 
@@ -127,6 +146,7 @@ def dijkstra(graph: Dict[int, Node], start: int) -> Dict[int, int]:
     Dijkstra's algorithm to find the shortest paths from a single source node to all other nodes in a graph.
 
     Assumption: The graph is weighted and does not contain negative edge weights.
+    CSR: A graph_csr.CSRGraph is accepted as well; vertices (start and results) are then its integer ids.
     Type Annotation:
         graph: Dict[int, Node] - Dictionary representing the graph with integer keys and Node values.
         start: int - Starting node for Dijkstra's algorithm.
@@ -134,19 +154,23 @@ def dijkstra(graph: Dict[int, Node], start: int) -> Dict[int, int]:
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Use priority queue (heapq) to efficiently select the next vertex with the smallest distance.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.dijkstra(graph, start)
+
     distances = defaultdict(lambda: float('inf'))
     distances[start] = 0
     pq = [(0, start)]
 
     while pq:
+        # The heap holds vertex values, not Node objects, so equal distances never compare two Nodes
         dist, current = heapq.heappop(pq)
         if dist > distances[current]:
             continue
-        for neighbor in current.neighbors:
+        for neighbor in graph[current].neighbors:
             new_dist = dist + neighbor.weight
             if new_dist < distances[neighbor.val]:
                 distances[neighbor.val] = new_dist
-                heapq.heappush(pq, (new_dist, neighbor))
+                heapq.heappush(pq, (new_dist, neighbor.val))
 
     return distances
 
@@ -156,12 +180,16 @@ def prim(graph: Dict[int, Node]) -> Dict[int, int]:
     Prim's algorithm to find the minimum spanning tree (MST) of a connected, undirected graph.
 
     Assumption: The graph is connected and undirected.
+    CSR: A graph_csr.CSRGraph is accepted as well; the tree is then grown from vertex id 0 and keyed by its integer vertex ids.
     Type Annotation:
         graph: Dict[int, Node] - Dictionary representing the graph with integer keys and Node values.
     Time Complexity: O((V + E) * log(V)) where V is the number of vertices and E is the number of edges.
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Use priority queue (heapq) to efficiently select the next edge with the smallest weight.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.prim(graph)
+
     visited = set()
     mst = {}
     pq = [(0, None, graph[next(iter(graph))])]  # Start from any node
@@ -183,12 +211,16 @@ def kruskal(graph: Dict[int, Node]) -> Dict[int, int]:
     Kruskal's algorithm to find the minimum spanning tree (MST) of a connected, undirected graph.
 
     Assumption: The graph is connected and undirected.
+    CSR: A graph_csr.CSRGraph is accepted as well; the tree edges are then pairs of its integer vertex ids.
     Type Annotation:
         graph: Dict[int, Node] - Dictionary representing the graph with integer keys and Node values.
     Time Complexity: O(E * log(E)) where E is the number of edges.
     Space Complexity: O(E) where E is the number of edges.
     Trick: Use Union-Find data structure to efficiently detect cycles while selecting edges.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.kruskal(graph)
+
     def find(node):
         if node.parent != node:
             node.parent = find(node.parent)
@@ -227,6 +259,7 @@ def bellman_ford(graph: Dict[int, Node], start: int) -> Dict[int, int]:
     Bellman-Ford algorithm to find the shortest paths from a single source node to all other nodes in a graph.
 
     Assumption: The graph may contain negative edge weights but should not contain negative cycles.
+    CSR: A graph_csr.CSRGraph is accepted as well; vertices (start and results) are then its integer ids.
     Type Annotation:
         graph: Dict[int, Node] - Dictionary representing the graph with integer keys and Node values.
         start: int - Starting node for Bellman-Ford algorithm.
@@ -234,6 +267,9 @@ def bellman_ford(graph: Dict[int, Node], start: int) -> Dict[int, int]:
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Relax edges repeatedly to find the shortest paths.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.bellman_ford(graph, start)
+
     vertices = list(graph.keys())
     distances = {v: float('inf') for v in vertices}
     distances[start] = 0
@@ -252,12 +288,16 @@ def floyd_warshall(graph: Dict[int, Node]) -> Dict[Tuple[int, int], int]:
     Floyd-Warshall algorithm to find all pair shortest paths in a weighted graph.
 
     Assumption: The graph may contain negative edge weights but should not contain negative cycles.
+    CSR: A graph_csr.CSRGraph is accepted as well; the result is then one distance array per vertex id.
     Type Annotation:
         graph: Dict[int, Node] - Dictionary representing the graph with integer keys and Node values.
     Time Complexity: O(V^3) where V is the number of vertices.
     Space Complexity: O(V^2) where V is the number of vertices.
     Trick: Dynamic Programming approach to solve all pair shortest paths.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.floyd_warshall(graph)
+
     vertices = list(graph.keys())
     n = len(vertices)
     distances = {(u, v): float('inf') for u in vertices for v in vertices}
@@ -279,12 +319,16 @@ def has_cycle(graph: Dict[int, Node]) -> bool:
     Cycle detection algorithm to detect cycles in an undirected graph.
 
     Assumption: The graph is undirected.
+    CSR: A graph_csr.CSRGraph is accepted as well (both directions of every edge stored).
     Type Annotation:
         graph: Dict[int, Node] - Dictionary representing the graph with integer keys and Node values.
     Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
     Space Complexity: O(V) where V is the number of vertices.
     Trick: Use Union-Find data structure to detect cycles.
     """
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.has_cycle(graph)
+
     def find(node):
         if node.parent != node:
             node.parent = find(node.parent)
@@ -320,43 +364,19 @@ def find_cut_vertices(graph: Dict[int, Node]) -> Set[int]:
     Cut vertex (articulation point) detection algorithm to find the vertices whose removal would increase the number of connected components.
 
     Assumption: The graph is undirected.
+    CSR: A graph_csr.CSRGraph is accepted as well; vertices (results) are then its integer ids.
     Type Annotation:
         graph: Dict[int, Node] - Dictionary representing the graph with integer keys and Node values.
     Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
-    Space Complexity: O(V) where V is the number of vertices.
-    Trick: Use DFS to detect articulation points.
+    Space Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Trick: Use DFS to detect articulation points. The DFS runs on an explicit stack (graph_csr.biconnected_components),
+    so deep graphs do not hit the recursion limit.
     """
-    def dfs(node, parent, visited, disc, low, result):
-        children = 0
-        visited.add(node)
-        disc[node] = time[0]
-        low[node] = time[0]
-        time[0] += 1
+    if isinstance(graph, graph_csr.CSRGraph):
+        return graph_csr.biconnected_components(graph)[0]
 
-        for neighbor in node.neighbors:
-            if neighbor.val != parent:
-                if neighbor not in visited:
-                    children += 1
-                    dfs(neighbor, node, visited, disc, low, result)
-                    low[node] = min(low[node], low[neighbor])
-                    if parent is None and children > 1:
-                        result.add(node.val)
-                    elif parent is not None and low[neighbor] >= disc[node]:
-                        result.add(node.val)
-                else:
-                    low[node] = min(low[node], disc[neighbor])
-
-    visited = set()
-    disc = {}
-    low = {}
-    result = set()
-    time = [0]
-
-    for node in graph.values():
-        if node not in visited:
-            dfs(node, None, visited, disc, low, result)
-
-    return result
+    csr = graph_csr.CSRGraph.from_nodes(graph)
+    return {csr.vertex_label(v) for v in graph_csr.biconnected_components(csr)[0]}
 
 # Example usage:
 
@@ -382,6 +402,12 @@ print("BFS traversal:", bfs(node1))
 # Topological Sort example usage
 print("Topological Sort:", topological_sort(node1))
 
+# CSR example usage (before the weighted examples, which give the nodes weight attributes)
+csr_graph = graph_csr.CSRGraph.from_nodes(graph)
+print("DFS traversal (CSR):", [csr_graph.vertex_label(v) for v in dfs(csr_graph, csr_graph.vertex_id(1))])
+print("BFS traversal (CSR):", [csr_graph.vertex_label(v) for v in bfs(csr_graph, csr_graph.vertex_id(1))])
+print("Graph has cycle (CSR):", has_cycle(csr_graph))
+
 # Dijkstra's Algorithm example usage
 node1.neighbors[0].weight = 4
 node1.neighbors[1].weight = 3
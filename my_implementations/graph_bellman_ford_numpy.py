@@ -0,0 +1,66 @@
+from typing import Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Edge List -> Columnar Arrays
+def edge_arrays(graph: Iterable[Sequence[float]], dtype: Optional[np.dtype] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Splits an edge list of (source, target, weight) rows into three NumPy columns.
+
+    Assumption: Vertices are the integer ids 0..V-1.
+    Type Annotation:
+        graph: Iterable[Sequence[float]] - Edge list, e.g. [(0, 1, 4), (1, 2, -2)] or [[s, d, w], ...].
+        dtype: np.dtype - dtype of the weight column; inferred from the weights (int or float) by default.
+    Time Complexity: O(E) where E is the number of edges.
+    Space Complexity: O(E)
+    Trick: Build the arrays once and reuse them for every source instead of converting the list per call.
+    """
+    edges = list(graph)
+    sources = np.fromiter((edge[0] for edge in edges), dtype=np.intp, count=len(edges))
+    targets = np.fromiter((edge[1] for edge in edges), dtype=np.intp, count=len(edges))
+    weights = np.asarray([edge[2] for edge in edges], dtype=dtype)
+    return sources, targets, weights
+
+
+# Vectorized Bellman-Ford Algorithm
+def bellman_ford_numpy(sources: np.ndarray, targets: np.ndarray, weights: np.ndarray, start: int,
+                       num_vertices: Optional[int] = None) -> np.ndarray:
+    """
+    Bellman-Ford algorithm where every relaxation round is one gather plus one scatter-minimum over all edges.
+
+    Assumption: The graph may contain negative edge weights but should not contain negative cycles.
+    Type Annotation:
+        sources, targets: np.ndarray - Integer vertex ids of every edge (see edge_arrays).
+        weights: np.ndarray - Weight of every edge.
+        start: int - Starting vertex id.
+        num_vertices: int - V; defaults to the largest vertex id in the edges (or start) plus one.
+    Time Complexity: O(V * E) arithmetic but only O(V) Python-level operations, usually far fewer rounds.
+    Space Complexity: O(V + E)
+    Trick: A round is candidate = distances[sources] + weights followed by np.minimum.at(new, targets, candidate).
+    Rounds read the previous round's distances, so after k rounds every path of at most k edges is settled;
+    the loop stops at the first round that changes nothing.
+    Raises: ValueError when a round after V - 1 still changes a distance (negative cycle reachable from start).
+    Returns: float64 array of distances indexed by vertex id; unreachable vertices are inf.
+    """
+    if num_vertices is None:
+        num_vertices = int(max(sources.max(initial=-1), targets.max(initial=-1), start)) + 1
+    distances = np.full(num_vertices, np.inf)
+    distances[start] = 0
+    weights = weights.astype(np.float64, copy=False)
+
+    for _ in range(num_vertices):
+        relaxed = distances.copy()
+        np.minimum.at(relaxed, targets, distances[sources] + weights)
+        if np.array_equal(relaxed, distances):
+            return distances
+        distances = relaxed
+
+    raise ValueError("Graph contains a negative cycle")
+
+
+# Example usage:
+if __name__ == "__main__":
+    sources, targets, weights = edge_arrays([(0, 1, 4), (0, 2, 3), (1, 3, -2), (2, 1, 1), (2, 3, 5)])
+    print("Vectorized Bellman-Ford:", bellman_ford_numpy(sources, targets, weights, 0))
+    # Expected output: [0. 4. 3. 2.]
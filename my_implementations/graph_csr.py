@@ -0,0 +1,1177 @@
+from array import array
+from collections import deque
+import heapq
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+INF = float('inf')
+
+
+# Compressed Sparse Row (CSR) Graph
+class CSRGraph:
+    """
+    Compressed sparse row graph with integer vertex ids 0..V-1.
+
+    Assumption: The graph is static once built; edges are directed (an undirected graph stores both directions).
+    Layout:
+        offsets: array('q') of length V + 1 - edges of vertex v live at positions offsets[v]..offsets[v + 1] - 1.
+        targets: array('i') of length E - destination vertex id of every edge.
+        weights: array('d') of length E, or None for an unweighted graph (every edge then weighs 1).
+        labels: List of original vertex labels indexed by vertex id, or None when the labels already are 0..V-1.
+    Space Complexity: O(V + E) - 8 bytes per vertex plus 4 bytes (12 when weighted) per edge.
+    Trick: Keep every edge in flat typed arrays so the neighbors of a vertex are one contiguous slice instead of a list of Python objects.
+    """
+    def __init__(self, offsets: array, targets: array, weights: Optional[array] = None,
+                 labels: Optional[List[Hashable]] = None):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.labels = labels
+        self._index: Optional[Dict[Hashable, int]] = None
+
+    @property
+    def num_vertices(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    # Function to build a CSR graph from parallel source/target/weight sequences
+    # Time Complexity: O(V + E)
+    # Space Complexity: O(V + E)
+    @classmethod
+    def from_arrays(cls, num_vertices: int, sources: Sequence[int], targets: Sequence[int],
+                    weights: Optional[Sequence[float]] = None,
+                    labels: Optional[List[Hashable]] = None) -> 'CSRGraph':
+        """
+        Builds a CSR graph from edges given as parallel arrays of vertex ids.
+
+        Trick: Counting sort by source vertex - count out-degrees, prefix-sum them into offsets,
+        then drop every edge into its slot. The sort is stable, so each vertex keeps its original neighbor order.
+
+        Example Usage: Used by every converter below and directly when edges are already integer arrays.
+        """
+        num_edges = len(sources)
+        offsets = array('q', bytes(8 * (num_vertices + 1)))
+        for u in sources:
+            offsets[u + 1] += 1
+        for v in range(num_vertices):
+            offsets[v + 1] += offsets[v]
+
+        cursor = offsets[:-1]
+        out_targets = array('i', bytes(4 * num_edges))
+        out_weights = array('d', bytes(8 * num_edges)) if weights is not None else None
+        for i in range(num_edges):
+            u = sources[i]
+            position = cursor[u]
+            out_targets[position] = targets[i]
+            if out_weights is not None:
+                out_weights[position] = weights[i]
+            cursor[u] = position + 1
+
+        return cls(offsets, out_targets, out_weights, labels)
+
+    # Function to convert a dict-of-lists adjacency list
+    # Time Complexity: O(V + E)
+    # Space Complexity: O(V + E)
+    @classmethod
+    def from_adjacency_list(cls, graph: Dict[Hashable, Iterable[Any]], weighted: Optional[bool] = None) -> 'CSRGraph':
+        """
+        Converts the adjacency list used by graph_algo_adjacency_list.py.
+
+        Accepts Dict[int, List[int]] (unweighted), Dict[int, List[Tuple[int, int]]] (weighted)
+        and Dict[int, Dict[int, int]] (neighbor -> weight).
+        weighted: True when every neighbor is a (neighbor, weight) pair, False when every neighbor is a plain
+        label (never unpacked, so tuple labels such as grid coordinates are safe). None decides once for the
+        whole graph: weighted when the neighbors are dicts or the first neighbor is a tuple.
+
+        Trick: Vertex ids follow the dict order, so a graph keyed 0..V-1 keeps its own numbering.
+
+        Example Usage: CSRGraph.from_adjacency_list({(0, 0): [(0, 1)], (0, 1): [(0, 0)]}, weighted=False)
+        """
+        if weighted is None:
+            weighted = False
+            for neighbors in graph.values():
+                if isinstance(neighbors, dict):
+                    weighted = True
+                    break
+                for neighbor in neighbors:
+                    weighted = isinstance(neighbor, tuple)
+                    break
+                else:
+                    continue
+                break
+
+        builder = _EdgeBuilder()
+        for node in graph:
+            builder.vertex(node)
+        for node, neighbors in graph.items():
+            if not weighted:
+                for neighbor in neighbors:
+                    builder.edge(node, neighbor)
+                continue
+            if isinstance(neighbors, dict):
+                neighbors = neighbors.items()
+            for neighbor, weight in neighbors:
+                builder.edge(node, neighbor, weight)
+        return builder.build(cls)
+
+    # Function to convert an edge list
+    # Time Complexity: O(V + E)
+    # Space Complexity: O(V + E)
+    @classmethod
+    def from_edge_list(cls, graph: Iterable[Tuple], directed: bool = True) -> 'CSRGraph':
+        """
+        Converts the edge list used by graph_algo_edge_list.py.
+
+        Accepts (u, v) or (u, v, weight) tuples. Pass directed=False to store every edge in both directions.
+
+        Trick: The edge list is consumed once, so a generator over a file works as well as a list.
+
+        Example Usage: CSRGraph.from_edge_list([(0, 1, 4), (1, 2, 3)], directed=False)
+        """
+        builder = _EdgeBuilder()
+        for edge in graph:
+            builder.edge(*edge)
+            if not directed:
+                builder.edge(edge[1], edge[0], *edge[2:])
+        return builder.build(cls)
+
+    # Function to convert an adjacency matrix
+    # Time Complexity: O(V^2)
+    # Space Complexity: O(V + E)
+    @classmethod
+    def from_adjacency_matrix(cls, graph: List[List[float]]) -> 'CSRGraph':
+        """
+        Converts the adjacency matrix used by graph_algo_adjacency_matrix.py.
+
+        Assumption: A cell that is 0, None or infinite means "no edge"; any other value is the edge weight.
+
+        Trick: A matrix is already indexed 0..V-1, so no label table is needed.
+
+        Example Usage: CSRGraph.from_adjacency_matrix([[0, 4], [4, 0]])
+        """
+        sources = array('i')
+        targets = array('i')
+        weights = array('d')
+        for i, row in enumerate(graph):
+            for j, cell in enumerate(row):
+                if cell and cell != INF:
+                    sources.append(i)
+                    targets.append(j)
+                    weights.append(cell)
+        return cls.from_arrays(len(graph), sources, targets, weights)
+
+    # Function to convert a linked graph of Node objects
+    # Time Complexity: O(V + E)
+    # Space Complexity: O(V + E)
+    @classmethod
+    def from_nodes(cls, graph: Any) -> 'CSRGraph':
+        """
+        Converts the linked representation used by graph_algo_linkedList.py (Dict[int, Node] or an iterable of nodes).
+
+        Assumption: Every node has `val` and `neighbors`. Edge weights come from a parallel `weights`
+        list when the node has one, otherwise from the neighbor's `weight` attribute, otherwise 1.
+
+        Trick: Nodes reachable only through `neighbors` are picked up as well, so passing the start node's
+        component is enough.
+
+        Example Usage: CSRGraph.from_nodes({1: node1, 2: node2})
+        """
+        nodes = list(graph.values()) if isinstance(graph, dict) else list(graph)
+        builder = _EdgeBuilder()
+        seen = set()
+        stack = nodes[::-1]
+        order = []
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            order.append(node)
+            builder.vertex(node.val)
+            stack.extend(reversed(node.neighbors))
+
+        for node in order:
+            weights = getattr(node, 'weights', None)
+            for i, neighbor in enumerate(node.neighbors):
+                if weights:
+                    weight = weights[i]
+                else:
+                    weight = getattr(neighbor, 'weight', None)
+                if weight is None:
+                    builder.edge(node.val, neighbor.val)
+                else:
+                    builder.edge(node.val, neighbor.val, weight)
+        return builder.build(cls)
+
+    # Function to map an original label to its vertex id
+    # Time Complexity: O(1) (O(V) once to build the index)
+    # Space Complexity: O(V)
+    def vertex_id(self, label: Hashable) -> int:
+        if self.labels is None:
+            return label
+        if self._index is None:
+            self._index = {node: i for i, node in enumerate(self.labels)}
+        return self._index[label]
+
+    # Function to map a vertex id back to its original label
+    # Time Complexity: O(1)
+    # Space Complexity: O(1)
+    def vertex_label(self, vertex: int) -> Hashable:
+        return vertex if self.labels is None else self.labels[vertex]
+
+    def neighbors(self, vertex: int) -> array:
+        return self.targets[self.offsets[vertex]:self.offsets[vertex + 1]]
+
+    def edges(self, vertex: int) -> Iterable[Tuple[int, float]]:
+        start, end = self.offsets[vertex], self.offsets[vertex + 1]
+        if self.weights is None:
+            return ((self.targets[i], 1) for i in range(start, end))
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def out_degree(self, vertex: int) -> int:
+        return self.offsets[vertex + 1] - self.offsets[vertex]
+
+    # Function to build the transposed graph (every edge reversed)
+    # Time Complexity: O(V + E)
+    # Space Complexity: O(V + E)
+    def reverse(self) -> 'CSRGraph':
+        sources = array('i', bytes(4 * self.num_edges))
+        for u in range(self.num_vertices):
+            for i in range(self.offsets[u], self.offsets[u + 1]):
+                sources[i] = u
+        return CSRGraph.from_arrays(self.num_vertices, self.targets, sources, self.weights, self.labels)
+
+    def __len__(self) -> int:
+        return self.num_vertices
+
+    def __repr__(self) -> str:
+        return f"CSRGraph(num_vertices={self.num_vertices}, num_edges={self.num_edges})"
+
+
+class _EdgeBuilder:
+    """Collects labelled edges into typed arrays and interns labels to vertex ids on the fly."""
+    def __init__(self):
+        self.index: Dict[Hashable, int] = {}
+        self.labels: List[Hashable] = []
+        self.sources = array('i')
+        self.targets = array('i')
+        self.weights = array('d')
+        self.weighted = False
+
+    def vertex(self, label: Hashable) -> int:
+        vertex = self.index.get(label)
+        if vertex is None:
+            vertex = self.index[label] = len(self.labels)
+            self.labels.append(label)
+        return vertex
+
+    def edge(self, source: Hashable, target: Hashable, weight: Optional[float] = None) -> None:
+        self.sources.append(self.vertex(source))
+        self.targets.append(self.vertex(target))
+        if weight is None:
+            self.weights.append(1)
+        else:
+            self.weights.append(weight)
+            self.weighted = True
+
+    def build(self, cls):
+        labels = self.labels
+        if all(label == i for i, label in enumerate(labels)):
+            labels = None
+        weights = self.weights if self.weighted else None
+        return cls.from_arrays(len(self.labels), self.sources, self.targets, weights, labels)
+
+
+# Depth First Search (DFS) Algorithm
+def dfs(graph: CSRGraph, start: int) -> List[int]:
+    """
+    DFS algorithm to traverse a CSR graph starting from a given vertex id.
+
+    Type Annotation:
+        graph: CSRGraph - Compressed sparse row graph.
+        start: int - Starting vertex id for DFS traversal.
+    Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Space Complexity: O(V) where V is the number of vertices.
+    Trick: Keep (vertex, next edge position) pairs on an explicit stack, which visits vertices in the same
+    order as the recursive version without touching the recursion limit.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(graph.num_vertices)
+    visited[start] = 1
+    traversal_order = [start]
+    stack = [(start, offsets[start])]
+
+    while stack:
+        node, position = stack[-1]
+        end = offsets[node + 1]
+        while position < end and visited[targets[position]]:
+            position += 1
+        if position == end:
+            stack.pop()
+            continue
+        stack[-1] = (node, position + 1)
+        neighbor = targets[position]
+        visited[neighbor] = 1
+        traversal_order.append(neighbor)
+        stack.append((neighbor, offsets[neighbor]))
+
+    return traversal_order
+
+
+# Breadth First Search (BFS) Algorithm
+def bfs(graph: CSRGraph, start: int) -> List[int]:
+    """
+    BFS algorithm to traverse a CSR graph starting from a given vertex id.
+
+    Type Annotation:
+        graph: CSRGraph - Compressed sparse row graph.
+        start: int - Starting vertex id for BFS traversal.
+    Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Space Complexity: O(V) where V is the number of vertices.
+    Trick: Mark vertices in a bytearray when they are enqueued so each vertex enters the queue once.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(graph.num_vertices)
+    visited[start] = 1
+    traversal_order = []
+    queue = deque([start])
+
+    while queue:
+        node = queue.popleft()
+        traversal_order.append(node)
+        for i in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[i]
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                queue.append(neighbor)
+
+    return traversal_order
+
+
+
+# Direction-Optimizing BFS
+def direction_optimizing_bfs(graph: CSRGraph, start: int, reversed_graph: Optional[CSRGraph] = None,
+                             alpha: float = 14, beta: float = 24) -> Tuple[array, array]:
+    """
+    Level-synchronous BFS that switches between top-down and bottom-up steps (Beamer et al.).
+
+    Type Annotation:
+        graph: CSRGraph - Compressed sparse row graph.
+        start: int - Starting vertex id.
+        reversed_graph: CSRGraph - Optional transpose of graph (graph.reverse()); pass graph itself when it is undirected.
+        alpha, beta: float - Go bottom-up when the frontier's edges exceed 1/alpha of the unexplored edges,
+        back to top-down when the frontier holds fewer than 1/beta of the vertices.
+    Time Complexity: O(V + E) worst case; on low-diameter graphs the large middle levels check far fewer edges.
+    Space Complexity: O(V) where V is the number of vertices.
+    Trick: Top-down walks the out-edges of the frontier. Bottom-up lets every unvisited vertex scan its in-edges
+    for a parent in the frontier (a bytearray) and stop at the first hit, which is cheaper once the frontier is
+    a large part of the graph. Each level is finished before the next starts, so both give the same depths.
+    Returns: (depth, parent) - array('i') indexed by vertex id, -1 when unreachable; parent[start] = start.
+    """
+    n = graph.num_vertices
+    offsets, targets = graph.offsets, graph.targets
+    depth = array('i', [-1]) * n
+    parent = array('i', [-1]) * n
+    depth[start] = 0
+    parent[start] = start
+    frontier = [start]
+    unexplored_edges = graph.num_edges - graph.out_degree(start)
+    unvisited = None
+    bottom_up = False
+    level = 0
+
+    while frontier:
+        frontier_edges = sum(offsets[u + 1] - offsets[u] for u in frontier)
+        if not bottom_up and frontier_edges * alpha > unexplored_edges:
+            bottom_up = True
+        elif bottom_up and len(frontier) * beta < n:
+            bottom_up = False
+        level += 1
+        next_frontier = []
+
+        if bottom_up:
+            if reversed_graph is None:
+                reversed_graph = graph.reverse()
+            in_offsets, sources = reversed_graph.offsets, reversed_graph.targets
+            in_frontier = bytearray(n)
+            for u in frontier:
+                in_frontier[u] = 1
+            unvisited = [v for v in (range(n) if unvisited is None else unvisited) if depth[v] == -1]
+            for v in unvisited:
+                for i in range(in_offsets[v], in_offsets[v + 1]):
+                    u = sources[i]
+                    if in_frontier[u]:
+                        depth[v] = level
+                        parent[v] = u
+                        next_frontier.append(v)
+                        break
+        else:
+            for u in frontier:
+                for i in range(offsets[u], offsets[u + 1]):
+                    v = targets[i]
+                    if depth[v] == -1:
+                        depth[v] = level
+                        parent[v] = u
+                        next_frontier.append(v)
+
+        unexplored_edges -= sum(offsets[v + 1] - offsets[v] for v in next_frontier)
+        frontier = next_frontier
+
+    return depth, parent
+
+
+# Topological Sort Algorithm
+def topological_sort(graph: CSRGraph) -> List[int]:
+    """
+    Topological sort algorithm to find the linear ordering of vertex ids in a directed acyclic CSR graph.
+
+    Assumption: The graph is a directed acyclic graph (DAG).
+    Type Annotation:
+        graph: CSRGraph - Compressed sparse row graph.
+    Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Space Complexity: O(V) where V is the number of vertices.
+    Trick: DFS post-order reversed, with an explicit stack of vertices and a per-vertex edge cursor in place of
+    recursion; roots are taken in vertex id order, so the result matches the recursive versions.
+    """
+    n = graph.num_vertices
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(n)
+    cursor = array('q', offsets[:-1])
+    order = []
+
+    for root in range(n):
+        if visited[root]:
+            continue
+        visited[root] = 1
+        stack = [root]
+        while stack:
+            node = stack[-1]
+            i = cursor[node]
+            if i < offsets[node + 1]:
+                cursor[node] = i + 1
+                neighbor = targets[i]
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    stack.append(neighbor)
+            else:
+                order.append(stack.pop())
+
+    order.reverse()
+    return order
+
+# Dijkstra's Algorithm
+def dijkstra(graph: CSRGraph, start: int) -> array:
+    """
+    Dijkstra's algorithm to find the shortest paths from a single source vertex id to all other vertices.
+
+    Assumption: The graph does not contain negative edge weights.
+    Type Annotation:
+        graph: CSRGraph - Compressed sparse row graph.
+        start: int - Starting vertex id for Dijkstra's algorithm.
+    Time Complexity: O((V + E) * log(V)) where V is the number of vertices and E is the number of edges.
+    Space Complexity: O(V) where V is the number of vertices.
+    Trick: Distances live in an array('d') indexed by vertex id; unreachable vertices stay at inf.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    weights = graph.weights
+    distances = array('d', [INF]) * graph.num_vertices
+    distances[start] = 0
+    pq = [(0, start)]
+
+    while pq:
+        distance, node = heapq.heappop(pq)
+        if distance > distances[node]:
+            continue
+        for i in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[i]
+            new_distance = distance + (weights[i] if weights is not None else 1)
+            if new_distance < distances[neighbor]:
+                distances[neighbor] = new_distance
+                heapq.heappush(pq, (new_distance, neighbor))
+
+    return distances
+
+
+# Bidirectional Dijkstra's Algorithm
+def bidirectional_dijkstra(graph: CSRGraph, start: int, target: int,
+                           reversed_graph: Optional[CSRGraph] = None) -> Tuple[float, List[int]]:
+    """
+    Bidirectional Dijkstra's algorithm to find the shortest path between a single pair of vertex ids.
+
+    Assumption: The graph does not contain negative edge weights.
+    Type Annotation:
+        graph: CSRGraph - Compressed sparse row graph.
+        start: int - Source vertex id.
+        target: int - Destination vertex id.
+        reversed_graph: CSRGraph - Optional graph.reverse(), built once and reused across queries.
+    Time Complexity: O((V + E) * log(V)) worst case, but only the two balls around start and target are settled.
+    Space Complexity: O(V) where V is the number of vertices.
+    Trick: Alternate between a forward search on the graph and a backward search on its transpose;
+    stop when the two smallest frontier distances add up to at least the best meeting distance.
+    Returns: (distance, path) - (inf, []) when target is unreachable.
+    """
+    if start == target:
+        return 0, [start]
+    if reversed_graph is None:
+        reversed_graph = graph.reverse()
+
+    n = graph.num_vertices
+    graphs = (graph, reversed_graph)
+    distances = (array('d', [INF]) * n, array('d', [INF]) * n)
+    parents = (array('i', [-1]) * n, array('i', [-1]) * n)
+    settled = (bytearray(n), bytearray(n))
+    distances[0][start] = 0
+    distances[1][target] = 0
+    pqs = ([(0, start)], [(0, target)])
+    best = INF
+    meeting = -1
+
+    while pqs[0] and pqs[1]:
+        if pqs[0][0][0] + pqs[1][0][0] >= best:
+            break
+        side = 0 if pqs[0][0][0] <= pqs[1][0][0] else 1
+        distance, node = heapq.heappop(pqs[side])
+        if settled[side][node]:
+            continue
+        settled[side][node] = 1
+        current = graphs[side]
+        offsets, targets, weights = current.offsets, current.targets, current.weights
+        forward, backward = distances[side], distances[1 - side]
+        for i in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[i]
+            new_distance = distance + (weights[i] if weights is not None else 1)
+            if new_distance < forward[neighbor]:
+                forward[neighbor] = new_distance
+                parents[side][neighbor] = node
+                heapq.heappush(pqs[side], (new_distance, neighbor))
+            if forward[neighbor] + backward[neighbor] < best:
+                best = forward[neighbor] + backward[neighbor]
+                meeting = neighbor
+
+    if meeting == -1:
+        return INF, []
+    path = []
+    node = meeting
+    while node != -1:
+        path.append(node)
+        node = parents[0][node]
+    path.reverse()
+    node = parents[1][meeting]
+    while node != -1:
+        path.append(node)
+        node = parents[1][node]
+    return best, path
+
+
+# Prim's Algorithm
+def prim(graph: CSRGraph, start: int = 0) -> Dict[int, float]:
+    """
+    Prim's algorithm to find the minimum spanning tree (MST) of a connected, undirected CSR graph.
+
+    Assumption: The graph is connected and undirected (both directions of every edge are stored).
+    Type Annotation:
+        graph: CSRGraph - Compressed sparse row graph.
+        start: int - Vertex id the tree is grown from.
+    Time Complexity: O((V + E) * log(V)) where V is the number of vertices and E is the number of edges.
+    Space Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Trick: Same lazy heap as the adjacency-list version; visited is a bytearray instead of a set.
+    Returns: {vertex id: weight of the tree edge that attached it}.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    weights = graph.weights
+    mst = {}
+    visited = bytearray(graph.num_vertices)
+    pq = [(0, start)]
+
+    while pq:
+        weight, node = heapq.heappop(pq)
+        if visited[node]:
+            continue
+        visited[node] = 1
+        if node != start:
+            mst[node] = weight
+        for i in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[i]
+            if not visited[neighbor]:
+                heapq.heappush(pq, (weights[i] if weights is not None else 1, neighbor))
+
+    return mst
+
+
+# Kruskal's Algorithm
+def kruskal(graph: CSRGraph) -> Dict[Tuple[int, int], float]:
+    """
+    Kruskal's algorithm to find the minimum spanning tree (MST) of an undirected CSR graph.
+
+    Assumption: The graph is undirected; the reverse copy of an edge is rejected by the union-find.
+    Type Annotation:
+        graph: CSRGraph - Compressed sparse row graph.
+    Time Complexity: O(E * log(E)) where E is the number of edges.
+    Space Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Trick: Sort edge positions instead of (weight, u, v) tuples, and keep the union-find parents in an array.
+    Returns: {(u, v): weight} over vertex ids.
+    """
+    n = graph.num_vertices
+    offsets, targets = graph.offsets, graph.targets
+    weights = graph.weights
+    sources = array('i', bytes(4 * graph.num_edges))
+    for u in range(n):
+        for i in range(offsets[u], offsets[u + 1]):
+            sources[i] = u
+
+    order = range(graph.num_edges)
+    if weights is not None:
+        order = sorted(order, key=weights.__getitem__)
+
+    parent = array('i', range(n))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    mst = {}
+    for i in order:
+        u, v = sources[i], targets[i]
+        root_u, root_v = find(u), find(v)
+        if root_u != root_v:
+            mst[(u, v)] = weights[i] if weights is not None else 1
+            parent[root_u] = root_v
+            if len(mst) == n - 1:
+                break
+
+    return mst
+
+
+# Bellman-Ford Algorithm
+def bellman_ford(graph: CSRGraph, start: int) -> array:
+    """
+    Bellman-Ford algorithm to find the shortest paths from a single source vertex id to all other vertices.
+
+    Assumption: The graph may contain negative edge weights but should not contain negative cycles.
+    Type Annotation:
+        graph: CSRGraph - Compressed sparse row graph.
+        start: int - Starting vertex id for Bellman-Ford algorithm.
+    Time Complexity: O(V * E) where V is the number of vertices and E is the number of edges.
+    Space Complexity: O(V) where V is the number of vertices.
+    Trick: Walk the edges vertex by vertex straight out of the CSR arrays and skip vertices that are still at inf.
+    """
+    n = graph.num_vertices
+    offsets, targets = graph.offsets, graph.targets
+    weights = graph.weights
+    distances = array('d', [INF]) * n
+    distances[start] = 0
+
+    for _ in range(n - 1):
+        changed = False
+        for node in range(n):
+            distance = distances[node]
+            if distance == INF:
+                continue
+            for i in range(offsets[node], offsets[node + 1]):
+                new_distance = distance + (weights[i] if weights is not None else 1)
+                if new_distance < distances[targets[i]]:
+                    distances[targets[i]] = new_distance
+                    changed = True
+        if not changed:
+            break
+
+    return distances
+
+
+
+# Floyd-Warshall Algorithm
+def floyd_warshall(graph: CSRGraph) -> List[array]:
+    """
+    Floyd-Warshall algorithm to find all pair shortest paths in a weighted CSR graph.
+
+    Assumption: The graph may contain negative edge weights but should not contain negative cycles.
+    Type Annotation:
+        graph: CSRGraph - Compressed sparse row graph.
+    Time Complexity: O(V^3) where V is the number of vertices.
+    Space Complexity: O(V^2) where V is the number of vertices.
+    Trick: One array('d') row per vertex instead of V^2 boxed floats; rows i with distances[i][k] == inf
+    cannot improve through k and are skipped. Parallel edges keep the lightest weight.
+    Returns: distances[u][v] as one array('d') per vertex id; unreachable pairs are inf.
+    """
+    n = graph.num_vertices
+    offsets, targets = graph.offsets, graph.targets
+    weights = graph.weights
+    distances = [array('d', [INF]) * n for _ in range(n)]
+    for u in range(n):
+        row = distances[u]
+        row[u] = 0
+        for i in range(offsets[u], offsets[u + 1]):
+            weight = weights[i] if weights is not None else 1
+            if weight < row[targets[i]]:
+                row[targets[i]] = weight
+
+    for k in range(n):
+        row_k = distances[k]
+        for i in range(n):
+            row_i = distances[i]
+            through_k = row_i[k]
+            if through_k == INF:
+                continue
+            for j in range(n):
+                if through_k + row_k[j] < row_i[j]:
+                    row_i[j] = through_k + row_k[j]
+
+    return distances
+
+
+# Johnson's Algorithm
+_pool_graph: Optional[CSRGraph] = None
+_pool_potentials: Optional[array] = None
+
+
+def _init_johnson_worker(graph: CSRGraph, potentials: array) -> None:
+    global _pool_graph, _pool_potentials
+    _pool_graph, _pool_potentials = graph, potentials
+
+
+def _johnson_row(source: int) -> array:
+    return _unweight_row(_pool_graph, _pool_potentials, source)
+
+
+def _unweight_row(graph: CSRGraph, potentials: array, source: int) -> array:
+    distances = dijkstra(graph, source)
+    shift = potentials[source]
+    for v in range(len(distances)):
+        if distances[v] != INF:
+            distances[v] += potentials[v] - shift
+    return distances
+
+
+def johnson(graph: CSRGraph, processes: Optional[int] = None) -> List[array]:
+    """
+    Johnson's algorithm to find all pair shortest paths in a sparse weighted graph.
+
+    Assumption: The graph may contain negative edge weights but should not contain negative cycles.
+    Type Annotation:
+        graph: CSRGraph - Compressed sparse row graph.
+        processes: int - Run the per-source Dijkstra passes on a multiprocessing.Pool of this size (None = serial).
+    Time Complexity: O(V * E + V * (V + E) * log(V)) where V is the number of vertices and E is the number of edges.
+    Space Complexity: O(V^2) for the result, O(V + E) for the reweighted graph.
+    Trick: bellman_ford from an extra vertex joined to every vertex by a 0-weight edge gives potentials h
+    with w(u, v) + h[u] - h[v] >= 0, so every row can then be computed with dijkstra and shifted back.
+    The pool workers receive the reweighted graph once (initializer) and only the source id per task.
+    Raises: ValueError when the graph contains a negative cycle.
+    Returns: distances[u][v] as one array('d') per source vertex id.
+    """
+    n = graph.num_vertices
+    offsets, targets = graph.offsets, graph.targets
+    if graph.weights is None:
+        return [dijkstra(graph, source) for source in range(n)]
+
+    sources = array('i', bytes(4 * graph.num_edges))
+    for u in range(n):
+        for i in range(offsets[u], offsets[u + 1]):
+            sources[i] = u
+    augmented = CSRGraph.from_arrays(n + 1, sources + array('i', [n]) * n, targets + array('i', range(n)),
+                                     graph.weights + array('d', bytes(8 * n)))
+    potentials = bellman_ford(augmented, n)[:n]
+
+    weights = array('d', bytes(8 * graph.num_edges))
+    for i in range(graph.num_edges):
+        weights[i] = graph.weights[i] + potentials[sources[i]] - potentials[targets[i]]
+        if weights[i] < 0:
+            raise ValueError("Graph contains a negative cycle")
+    reweighted = CSRGraph(offsets, targets, weights, graph.labels)
+
+    if processes is None:
+        return [_unweight_row(reweighted, potentials, source) for source in range(n)]
+
+    from multiprocessing import Pool
+    with Pool(processes, initializer=_init_johnson_worker, initargs=(reweighted, potentials)) as pool:
+        rows = pool.map(_johnson_row, range(n), chunksize=max(1, n // (4 * processes)))
+        pool.close()
+        pool.join()
+    return rows
+
+
+
+
+# Cycle Detection in Undirected Graph
+def has_cycle(graph: CSRGraph) -> bool:
+    """
+    Cycle detection algorithm to detect cycles in an undirected CSR graph.
+
+    Assumption: The graph is undirected (both directions of every edge are stored).
+    Type Annotation:
+        graph: CSRGraph - Compressed sparse row graph.
+    Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Space Complexity: O(V) where V is the number of vertices.
+    Trick: Iterative DFS with a per-vertex edge cursor; any edge to an already visited vertex other than the
+    parent is a back edge, i.e. a cycle.
+    """
+    n = graph.num_vertices
+    offsets, targets = graph.offsets, graph.targets
+    parent = array('i', [-1]) * n
+    visited = bytearray(n)
+    cursor = array('q', offsets[:-1])
+
+    for root in range(n):
+        if visited[root]:
+            continue
+        visited[root] = 1
+        stack = [root]
+        while stack:
+            node = stack[-1]
+            i = cursor[node]
+            if i == offsets[node + 1]:
+                stack.pop()
+                continue
+            cursor[node] = i + 1
+            neighbor = targets[i]
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                parent[neighbor] = node
+                stack.append(neighbor)
+            elif neighbor != parent[node]:
+                return True
+    return False
+
+
+# Cut Vertices, Bridges and Biconnected Components
+def biconnected_components(graph: CSRGraph) -> Tuple[Set[int], List[Tuple[int, int]], List[List[Tuple[int, int]]]]:
+    """
+    Articulation points, bridges and biconnected components of an undirected CSR graph in one DFS pass.
+
+    Assumption: The graph is undirected (both directions of every edge are stored).
+    Type Annotation:
+        graph: CSRGraph - Compressed sparse row graph.
+    Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Space Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Trick: Tarjan's low-link DFS with an explicit stack of vertices and a per-vertex edge cursor, so depth is
+    limited by memory rather than the recursion limit. Only the first edge back to the parent is skipped, which
+    keeps a parallel edge as a back edge. Tree and back edges go on an edge stack; when a child v of p has
+    low[v] >= disc[p], the edges down to (p, v) form one biconnected component, and low[v] > disc[p] makes
+    (p, v) a bridge.
+    Returns: (cut_vertices, bridges, components) - bridges as (parent, child) id pairs, every component as its edge list.
+    """
+    n = graph.num_vertices
+    offsets, targets = graph.offsets, graph.targets
+    disc = array('i', [-1]) * n
+    low = array('i', [0]) * n
+    parent = array('i', [-1]) * n
+    cursor = array('q', offsets[:-1])
+    skipped_parent = bytearray(n)
+    cut_vertices: Set[int] = set()
+    bridges: List[Tuple[int, int]] = []
+    components: List[List[Tuple[int, int]]] = []
+    edge_stack: List[Tuple[int, int]] = []
+    time = 0
+
+    for root in range(n):
+        if disc[root] != -1:
+            continue
+        disc[root] = low[root] = time
+        time += 1
+        root_children = 0
+        stack = [root]
+        while stack:
+            v = stack[-1]
+            i = cursor[v]
+            if i < offsets[v + 1]:
+                cursor[v] = i + 1
+                w = targets[i]
+                if w == parent[v] and not skipped_parent[v]:
+                    skipped_parent[v] = 1
+                elif disc[w] == -1:
+                    disc[w] = low[w] = time
+                    time += 1
+                    parent[w] = v
+                    edge_stack.append((v, w))
+                    stack.append(w)
+                    if v == root:
+                        root_children += 1
+                elif disc[w] < disc[v]:
+                    low[v] = min(low[v], disc[w])
+                    edge_stack.append((v, w))
+                continue
+
+            stack.pop()
+            p = parent[v]
+            if p == -1:
+                continue
+            low[p] = min(low[p], low[v])
+            if low[v] >= disc[p]:
+                if p != root:
+                    cut_vertices.add(p)
+                if low[v] > disc[p]:
+                    bridges.append((p, v))
+                component = []
+                while True:
+                    edge = edge_stack.pop()
+                    component.append(edge)
+                    if edge == (p, v):
+                        break
+                components.append(component)
+        if root_children > 1:
+            cut_vertices.add(root)
+
+    return cut_vertices, bridges, components
+
+
+# Strongly Connected Components (Tarjan)
+def strongly_connected_components(graph: CSRGraph) -> Tuple[array, int]:
+    """
+    Tarjan's algorithm to find the strongly connected components (SCCs) of a directed CSR graph.
+
+    Type Annotation:
+        graph: CSRGraph - Compressed sparse row graph.
+    Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Space Complexity: O(V) where V is the number of vertices.
+    Trick: The recursion is replaced by a call stack of vertices and a per-vertex edge cursor. Tarjan finishes
+    components in reverse topological order, so numbering them backwards gives ids in topological order:
+    every edge between two components goes from a smaller id to a larger one.
+    Returns: (component, count) - array('i') with the component id of every vertex, and the number of components.
+    """
+    n = graph.num_vertices
+    offsets, targets = graph.offsets, graph.targets
+    index = array('i', [-1]) * n
+    low = array('i', [0]) * n
+    component = array('i', [-1]) * n
+    cursor = array('q', offsets[:-1])
+    on_stack = bytearray(n)
+    stack: List[int] = []
+    time = 0
+    count = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = time
+        time += 1
+        stack.append(root)
+        on_stack[root] = 1
+        call = [root]
+        while call:
+            v = call[-1]
+            i = cursor[v]
+            if i < offsets[v + 1]:
+                cursor[v] = i + 1
+                w = targets[i]
+                if index[w] == -1:
+                    index[w] = low[w] = time
+                    time += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    call.append(w)
+                elif on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+                continue
+
+            call.pop()
+            if call and low[v] < low[call[-1]]:
+                low[call[-1]] = low[v]
+            if low[v] == index[v]:
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = 0
+                    component[w] = count
+                    if w == v:
+                        break
+                count += 1
+
+    for v in range(n):
+        component[v] = count - 1 - component[v]
+    return component, count
+
+
+# Condensation Graph
+def condensation(graph: CSRGraph) -> Tuple[CSRGraph, array]:
+    """
+    Builds the condensation of a directed CSR graph: one vertex per SCC, one edge per pair of linked SCCs.
+
+    Type Annotation:
+        graph: CSRGraph - Compressed sparse row graph.
+    Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Space Complexity: O(V + E)
+    Trick: The result is a DAG whose vertex ids are already a topological order; duplicate edges are dropped
+    with one "last source seen" marker per target component.
+    Returns: (dag, component) - the condensation and the component id of every original vertex.
+    """
+    component, count = strongly_connected_components(graph)
+    offsets, targets = graph.offsets, graph.targets
+    members: List[List[int]] = [[] for _ in range(count)]
+    for v in range(graph.num_vertices):
+        members[component[v]].append(v)
+
+    sources = array('i')
+    dag_targets = array('i')
+    last_source = array('i', [-1]) * count
+    for c in range(count):
+        for v in members[c]:
+            for i in range(offsets[v], offsets[v + 1]):
+                d = component[targets[i]]
+                if d != c and last_source[d] != c:
+                    last_source[d] = c
+                    sources.append(c)
+                    dag_targets.append(d)
+    return CSRGraph.from_arrays(count, sources, dag_targets), component
+
+# Multi-Source Dijkstra (Nearest-Source Labeling)
+def multi_source_dijkstra(graph: CSRGraph, sources: Iterable[int]) -> Tuple[array, array]:
+    """
+    One Dijkstra search started from every source at once, labeling each vertex with its nearest source.
+
+    Assumption: The graph does not contain negative edge weights.
+    Type Annotation:
+        graph: CSRGraph - Compressed sparse row graph.
+        sources: Iterable[int] - Source vertex ids (e.g. every warehouse).
+    Time Complexity: O((V + E) * log(V)) in total, however many sources there are.
+    Space Complexity: O(V) where V is the number of vertices.
+    Trick: Seed the heap with all sources at distance 0; each vertex is settled once, by whichever source
+    reaches it first, and inherits that source as its label.
+    Returns: (distances, nearest) - distance to the nearest source and that source's id (-1 when unreachable).
+    """
+    offsets, targets = graph.offsets, graph.targets
+    weights = graph.weights
+    distances = array('d', [INF]) * graph.num_vertices
+    nearest = array('i', [-1]) * graph.num_vertices
+    pq = []
+    for source in sources:
+        distances[source] = 0
+        nearest[source] = source
+        pq.append((0, source))
+    heapq.heapify(pq)
+
+    while pq:
+        distance, node = heapq.heappop(pq)
+        if distance > distances[node]:
+            continue
+        for i in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[i]
+            new_distance = distance + (weights[i] if weights is not None else 1)
+            if new_distance < distances[neighbor]:
+                distances[neighbor] = new_distance
+                nearest[neighbor] = nearest[node]
+                heapq.heappush(pq, (new_distance, neighbor))
+
+    return distances, nearest
+
+
+# Batched Single-Source Dijkstra
+_shared_memory = None
+
+
+def _init_shared_worker(name: str, num_vertices: int, num_edges: int, weighted: bool) -> None:
+    global _shared_memory, _pool_graph
+    from multiprocessing import shared_memory, util
+    _shared_memory = shared_memory.SharedMemory(name=name)
+    offsets_end = 8 * (num_vertices + 1)
+    targets_end = offsets_end + 4 * num_edges
+    buffer = _shared_memory.buf
+    _pool_graph = CSRGraph(buffer[:offsets_end].cast('q'), buffer[offsets_end:targets_end].cast('i'),
+                           buffer[targets_end:targets_end + 8 * num_edges].cast('d') if weighted else None)
+    util.Finalize(None, _close_shared_worker, exitpriority=10)
+
+
+def _close_shared_worker() -> None:
+    # The memoryviews must be released before the mapping can be closed
+    global _shared_memory, _pool_graph
+    for part in (_pool_graph.offsets, _pool_graph.targets, _pool_graph.weights):
+        if part is not None:
+            part.release()
+    _shared_memory.close()
+    _shared_memory = _pool_graph = None
+
+
+def _shared_dijkstra(source: int) -> array:
+    return dijkstra(_pool_graph, source)
+
+
+def dijkstra_many(graph: CSRGraph, sources: Iterable[int], processes: Optional[int] = None) -> List[array]:
+    """
+    Independent single-source Dijkstra searches for many sources, optionally spread over a process pool.
+
+    Assumption: The graph does not contain negative edge weights.
+    Type Annotation:
+        graph: CSRGraph - Compressed sparse row graph.
+        sources: Iterable[int] - Source vertex ids.
+        processes: int - Run the searches on a multiprocessing.Pool of this size (None = serial).
+    Time Complexity: O(S * (V + E) * log(V)) work for S sources, divided over the processes.
+    Space Complexity: O(S * V) for the result; the graph itself is stored once.
+    Trick: The offsets/targets/weights arrays are copied once into a multiprocessing.shared_memory block and
+    every worker maps them as memoryviews, so the graph is neither pickled per task nor copied per process.
+    Returns: One distance array('d') per source, in the order of sources.
+    """
+    sources = list(sources)
+    if processes is None:
+        return [dijkstra(graph, source) for source in sources]
+
+    from multiprocessing import Pool, shared_memory
+    weighted = graph.weights is not None
+    parts = [graph.offsets, graph.targets] + ([graph.weights] if weighted else [])
+    block = shared_memory.SharedMemory(create=True, size=max(1, sum(len(part) * part.itemsize for part in parts)))
+    try:
+        position = 0
+        for part in parts:
+            data = part.tobytes()
+            block.buf[position:position + len(data)] = data
+            position += len(data)
+        initargs = (block.name, graph.num_vertices, graph.num_edges, weighted)
+        with Pool(processes, initializer=_init_shared_worker, initargs=initargs) as pool:
+            rows = pool.map(_shared_dijkstra, sources, chunksize=max(1, len(sources) // (4 * processes)))
+            # Leaving the with block terminates the workers; close and join first so they exit normally
+            # and run their _close_shared_worker finalizer
+            pool.close()
+            pool.join()
+        return rows
+    finally:
+        block.close()
+        block.unlink()
+
+
+# Example usage:
+if __name__ == "__main__":
+    # Adjacency list -> CSR
+    csr_graph = CSRGraph.from_adjacency_list({
+        0: [1, 2],
+        1: [0, 2, 3],
+        2: [0, 1],
+        3: [1, 4],
+        4: [3]
+    })
+    print(csr_graph)
+    print("DFS traversal:", dfs(csr_graph, 0))  # Expected output: [0, 1, 2, 3, 4]
+    print("BFS traversal:", bfs(csr_graph, 0))  # Expected output: [0, 1, 2, 3, 4]
+    depth, parent = direction_optimizing_bfs(csr_graph, 0, csr_graph)
+    print("BFS depth and parent:", list(depth), list(parent))  # Expected output: [0, 1, 1, 2, 3] [0, 0, 0, 1, 3]
+
+    # Weighted edge list -> CSR
+    weighted_csr = CSRGraph.from_edge_list([(0, 1, 4), (0, 2, 3), (1, 3, 2), (2, 1, 1), (2, 3, 5)])
+    print("Dijkstra's shortest paths:", list(dijkstra(weighted_csr, 0)))  # Expected output: [0.0, 4.0, 3.0, 6.0]
+    print("Bidirectional Dijkstra 0 -> 3:", bidirectional_dijkstra(weighted_csr, 0, 3))  # Expected output: (6.0, [0, 1, 3])
+
+    # Adjacency matrix -> CSR
+    matrix_csr = CSRGraph.from_adjacency_matrix([
+        [0, 10, 20, 0, 0],
+        [10, 0, 30, 5, 0],
+        [20, 30, 0, 15, 6],
+        [0, 5, 15, 0, 8],
+        [0, 0, 6, 8, 0]
+    ])
+    print("Prim's Minimum Spanning Tree:", prim(matrix_csr))
+    print("Kruskal's Minimum Spanning Tree:", kruskal(matrix_csr))
+    print("Cut vertices, bridges, components:", biconnected_components(csr_graph))
+    print("Graph has cycle:", has_cycle(csr_graph))  # Expected output: True
+
+    cyclic_csr = CSRGraph.from_edge_list([(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 3)])
+    component, count = strongly_connected_components(cyclic_csr)
+    print("Strongly connected components:", list(component), count)  # Expected output: [0, 0, 0, 1, 1] 2
+    print("Condensation:", condensation(cyclic_csr)[0])  # Expected output: CSRGraph(num_vertices=2, num_edges=1)
+    print("Topological sort of the condensation:", topological_sort(condensation(cyclic_csr)[0]))  # Expected output: [0, 1]
+
+    negative_csr = CSRGraph.from_edge_list([(0, 1, 4), (0, 2, 3), (1, 3, -2), (2, 1, 1), (2, 3, 5)])
+    print("Bellman-Ford shortest paths:", list(bellman_ford(negative_csr, 0)))  # Expected output: [0.0, 4.0, 3.0, 2.0]
+    print("Floyd-Warshall all pair shortest paths:", [list(row) for row in floyd_warshall(negative_csr)])
+    print("Johnson all pair shortest paths:", [list(row) for row in johnson(negative_csr)])
+
+    distances, nearest = multi_source_dijkstra(weighted_csr, [1, 2])
+    print("Nearest source:", list(distances), list(nearest))  # Expected output: [inf, 0.0, 0.0, 2.0] [-1, 1, 2, 1]
@@ -0,0 +1,170 @@
+from typing import Dict, List, Sequence, Tuple
+
+
+# Union Find with Rollback
+class RollbackUnionFind:
+    """
+    Union Find with the same find/union interface as UnionFind in graph_algo_*.py, plus snapshot and rollback.
+
+    Assumption: Elements are the integers 0..n-1.
+    Time Complexity:
+        - Initialization: O(N) where N is the number of elements.
+        - Union: O(log N)
+        - Find: O(log N)
+        - Rollback: O(1) per undone union.
+    Space Complexity: O(N + U) where U is the number of unions not yet rolled back.
+    Trick: No path compression - union by rank alone keeps the trees O(log N) deep, and without compression
+    a union changes only one parent (and maybe one rank), so it can be undone from a stack of those changes.
+    """
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.rank = [0] * n
+        self.count = n
+        # (attached root, rank of the new root increased) for every successful union
+        self.history: List[Tuple[int, bool]] = []
+
+    def find(self, x: int) -> int:
+        while self.parent[x] != x:
+            x = self.parent[x]
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        root_x = self.find(x)
+        root_y = self.find(y)
+        if root_x == root_y:
+            return False
+        if self.rank[root_x] < self.rank[root_y]:
+            root_x, root_y = root_y, root_x
+        self.parent[root_y] = root_x
+        grew = self.rank[root_x] == self.rank[root_y]
+        if grew:
+            self.rank[root_x] += 1
+        self.history.append((root_y, grew))
+        self.count -= 1
+        return True
+
+    def connected(self, x: int, y: int) -> bool:
+        return self.find(x) == self.find(y)
+
+    def snapshot(self) -> int:
+        return len(self.history)
+
+    def rollback(self, snapshot: int) -> None:
+        while len(self.history) > snapshot:
+            root, grew = self.history.pop()
+            parent = self.parent[root]
+            self.parent[root] = root
+            if grew:
+                self.rank[parent] -= 1
+            self.count += 1
+
+
+# Offline Dynamic Connectivity
+def dynamic_connectivity(num_vertices: int, operations: Sequence[Tuple[str, int, int]]) -> List[bool]:
+    """
+    Answers connectivity queries on an undirected graph whose edges are added and removed over time.
+
+    Assumption: All operations are known up front (offline). Vertices are the integers 0..num_vertices-1.
+    Type Annotation:
+        num_vertices: int - Number of vertices.
+        operations: Sequence[Tuple[str, int, int]] - ("add", u, v), ("remove", u, v) or ("query", u, v) in time order.
+        Parallel edges are counted, so removing one copy of a doubled edge keeps u and v joined by the other.
+    Time Complexity: O((E + Q) * log(Q) * log(V)) where E is the number of add operations and Q the number of queries.
+    Space Complexity: O(V + E * log(Q))
+    Trick: Every edge is alive during one interval of query indices. Store it in the O(log Q) segment-tree nodes
+    that cover the interval, then walk the tree depth-first: union a node's edges on the way down, answer the
+    query at each leaf, and roll the unions back on the way up. Each edge is unioned once per covering node.
+    Raises: ValueError for an unknown operation or for removing an edge that is not present.
+    Returns: One bool per query, in order - True when u and v are connected at that point.
+    """
+    num_queries = 0
+    queries: List[Tuple[int, int]] = []
+    opened: Dict[Tuple[int, int], List[int]] = {}
+    intervals: List[Tuple[int, int, int, int]] = []
+    for operation, u, v in operations:
+        edge = (u, v) if u <= v else (v, u)
+        if operation == "add":
+            opened.setdefault(edge, []).append(num_queries)
+        elif operation == "remove":
+            if not opened.get(edge):
+                raise ValueError(f"edge {edge} is not in the graph")
+            start = opened[edge].pop()
+            if start < num_queries:
+                intervals.append((start, num_queries, u, v))
+        elif operation == "query":
+            queries.append((u, v))
+            num_queries += 1
+        else:
+            raise ValueError(f"unknown operation {operation!r}")
+    for (u, v), starts in opened.items():
+        for start in starts:
+            if start < num_queries:
+                intervals.append((start, num_queries, u, v))
+
+    if not num_queries:
+        return []
+
+    # Segment tree over query indices [0, num_queries); node 1 is the root, children of i are 2i and 2i + 1
+    size = 1
+    while size < num_queries:
+        size *= 2
+    tree: List[List[Tuple[int, int]]] = [[] for _ in range(2 * size)]
+    for start, end, u, v in intervals:
+        # Bottom-up cover of [start, end) by canonical nodes
+        left, right = start + size, end + size
+        while left < right:
+            if left & 1:
+                tree[left].append((u, v))
+                left += 1
+            if right & 1:
+                right -= 1
+                tree[right].append((u, v))
+            left //= 2
+            right //= 2
+
+    uf = RollbackUnionFind(num_vertices)
+    answers = [False] * num_queries
+    # Iterative DFS; a negative entry means "roll back to this snapshot" once the subtree is done
+    stack = [(1, 0)]
+    while stack:
+        node, snapshot = stack.pop()
+        if node < 0:
+            uf.rollback(snapshot)
+            continue
+        leaf = node - size
+        if leaf >= num_queries:
+            continue
+        snapshot = uf.snapshot()
+        for u, v in tree[node]:
+            uf.union(u, v)
+        stack.append((-1, snapshot))
+        if node >= size:
+            u, v = queries[leaf]
+            answers[leaf] = uf.connected(u, v)
+        else:
+            stack.append((2 * node + 1, 0))
+            stack.append((2 * node, 0))
+
+    return answers
+
+
+# Example usage:
+if __name__ == "__main__":
+    uf = RollbackUnionFind(4)
+    checkpoint = uf.snapshot()
+    uf.union(0, 1)
+    uf.union(1, 2)
+    print("0 ~ 2 before rollback:", uf.connected(0, 2))  # Expected output: True
+    uf.rollback(checkpoint)
+    print("0 ~ 2 after rollback:", uf.connected(0, 2))  # Expected output: False
+
+    print("Dynamic connectivity:", dynamic_connectivity(4, [
+        ("add", 0, 1),
+        ("add", 1, 2),
+        ("query", 0, 2),
+        ("remove", 0, 1),
+        ("query", 0, 2),
+        ("add", 0, 3),
+        ("add", 3, 2),
+        ("query", 0, 2),
+    ]))  # Expected output: [True, False, True]
@@ -0,0 +1,141 @@
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+
+# Vectorized Floyd-Warshall Algorithm
+def floyd_warshall_numpy(graph: Union[List[List[float]], np.ndarray], inf: float = float('inf'),
+                         dtype: Optional[np.dtype] = None, next_hop: bool = False,
+                         block_size: Optional[int] = None) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Floyd-Warshall algorithm where every k-step is one NumPy operation over the whole matrix.
+
+    Assumption: The graph may contain negative edge weights but should not contain negative cycles.
+    Type Annotation:
+        graph: List[List[float]] or np.ndarray - V x V weight matrix, graph[i][j] = inf (or the sentinel) when there is no edge.
+        inf: float - Sentinel used for "no edge" in the input and for "unreachable" in the output (e.g. INF = 9999).
+        dtype: np.dtype - Working dtype, e.g. np.float32 or np.int32. Defaults to the array's dtype, float64 for lists.
+        next_hop: bool - Also return a next-hop matrix for path recovery (see reconstruct_path).
+        block_size: int - Run the tiled variant on block_size x block_size tiles so each update stays in cache (useful for large V).
+    Time Complexity: O(V^3) arithmetic, but only O(V) (O(V^3 / block_size^2) when tiled) Python-level operations.
+    Space Complexity: O(V^2) where V is the number of vertices.
+    Trick: Step k is D = min(D, D[:, k, None] + D[None, k, :]) - a broadcast column + row, done in place.
+    Tiled variant: for every block of k values, first run those steps on the diagonal tile, then on the tiles in
+    the same tile row and tile column (which only need the diagonal tile and themselves), and finally on every
+    remaining tile, which only reads its own row's and column's tiles from the previous phase. Every update then
+    touches three block_size x block_size tiles instead of full V-wide rows.
+    Integer dtypes use a large finite value as infinity and clamp anything above half of it back to infinity.
+    Returns: distances, or (distances, next_hop) where next_hop[i][j] is the vertex after i on the path (-1 if none).
+    """
+    source = np.asarray(graph)
+    if dtype is None:
+        dtype = source.dtype if isinstance(graph, np.ndarray) else np.float64
+    dtype = np.dtype(dtype)
+    n = source.shape[0]
+    missing = np.isinf(source) if np.issubdtype(source.dtype, np.floating) else np.zeros(source.shape, dtype=bool)
+    if inf != float('inf'):
+        missing |= source == inf
+
+    if np.issubdtype(dtype, np.integer):
+        infinity = np.iinfo(dtype).max // 2
+    else:
+        infinity = np.inf
+    distances = np.where(missing, 0, source).astype(dtype)
+    distances[missing] = infinity
+
+    hops = None
+    if next_hop:
+        hops = np.where(missing, -1, np.arange(n, dtype=np.int32)[None, :]).astype(np.int32)
+
+    def relax(rows: slice, columns: slice, ks: range) -> None:
+        # D[rows, columns] = min(D[rows, columns], D[rows, k] + D[k, columns]) for every k in ks, in order
+        tile = distances[rows, columns]
+        candidate = np.empty_like(tile)
+        for k in ks:
+            np.add(distances[rows, k, None], distances[None, k, columns], out=candidate)
+            if hops is None:
+                np.minimum(tile, candidate, out=tile)
+            else:
+                improved = candidate < tile
+                tile[improved] = candidate[improved]
+                hop_tile = hops[rows, columns]
+                hop_tile[improved] = np.broadcast_to(hops[rows, k, None], hop_tile.shape)[improved]
+            if infinity is not np.inf:
+                tile[tile > infinity // 2] = infinity
+
+    if block_size is None or block_size >= n:
+        relax(slice(None), slice(None), range(n))
+    else:
+        tiles = [slice(start, min(start + block_size, n)) for start in range(0, n, block_size)]
+        for diagonal in tiles:
+            ks = range(diagonal.start, diagonal.stop)
+            relax(diagonal, diagonal, ks)
+            for other in tiles:
+                if other is not diagonal:
+                    relax(diagonal, other, ks)
+                    relax(other, diagonal, ks)
+            for rows in tiles:
+                if rows is diagonal:
+                    continue
+                for columns in tiles:
+                    if columns is not diagonal:
+                        relax(rows, columns, ks)
+
+    unreachable = distances >= infinity
+    if inf != float('inf') or infinity is not np.inf:
+        fill = inf if inf != float('inf') else infinity
+        if np.issubdtype(dtype, np.integer):
+            fill = min(fill, np.iinfo(dtype).max)
+        distances[unreachable] = fill
+    if hops is not None:
+        hops[unreachable] = -1
+        return distances, hops
+    return distances
+
+
+# Path Recovery from the Next-Hop Matrix
+def reconstruct_path(next_hop: np.ndarray, start: int, end: int) -> List[int]:
+    """
+    Rebuilds the shortest path from start to end using the next-hop matrix of floyd_warshall_numpy.
+
+    Type Annotation:
+        next_hop: np.ndarray - Next-hop matrix returned with next_hop=True.
+        start: int - Source vertex.
+        end: int - Destination vertex.
+    Time Complexity: O(P) where P is the number of vertices on the path.
+    Space Complexity: O(P)
+    Trick: Follow next_hop[current][end] until end is reached; an empty list means unreachable.
+    A path longer than V vertices means the hops went round a zero-weight cycle, which the tiled
+    variant can produce because its tiles see row and column tiles that are already further along.
+    """
+    if next_hop[start, end] == -1:
+        return []
+    path = [start]
+    while start != end:
+        if len(path) > len(next_hop):
+            raise ValueError("next-hop matrix loops (zero-weight cycle); rerun without block_size")
+        start = int(next_hop[start, end])
+        path.append(start)
+    return path
+
+
+# Example usage:
+if __name__ == "__main__":
+    INF = 9999
+    G = [[0, 8, INF, 1],
+         [INF, 0, 1, INF],
+         [4, INF, 0, INF],
+         [INF, 2, 9, 1]]
+
+    print("Vectorized Floyd-Warshall:")
+    print(floyd_warshall_numpy(G, inf=INF))
+    # Expected output:
+    # [[0. 3. 4. 1.]
+    #  [5. 0. 1. 6.]
+    #  [4. 7. 0. 5.]
+    #  [7. 2. 3. 1.]]
+
+    distances, next_hop = floyd_warshall_numpy(G, inf=INF, dtype=np.int32, next_hop=True, block_size=2)
+    print("Tiled int32 Floyd-Warshall:")
+    print(distances)
+    print("Path 0 -> 2:", reconstruct_path(next_hop, 0, 2))  # Expected output: [0, 3, 1, 2]
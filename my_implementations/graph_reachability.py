@@ -0,0 +1,150 @@
+from array import array
+from typing import Any, Dict, Hashable, List, Optional
+
+from graph_csr import CSRGraph, condensation
+
+
+# Reachability Index (SCC condensation + interval labels)
+class ReachabilityIndex:
+    """
+    Precomputed index that answers "can u reach v" for a static directed graph, mostly in O(1).
+
+    Assumption: The graph does not change after the index is built (rebuild it after edits).
+    Time Complexity:
+        - Build: O(K * (V + E)) where K is the number of interval labelings.
+        - Query: O(K) when a filter decides; otherwise a search of the condensation that the same filters prune.
+    Space Complexity: O(K * V + E)
+    Trick: Collapse every SCC into one node; two nodes of the same SCC reach each other. Component ids are in
+    topological order, so a later component never reaches an earlier one. Each DFS of the condensation gives
+    every component an interval [lowest post-order number below it, its own post-order number]; if u reaches v,
+    v's interval lies inside u's, so one disjoint interval is a definite "no" (GRAIL). Pre/post numbers of the
+    first DFS tree give a definite "yes" for tree descendants. Only the remaining pairs are searched.
+    """
+    def __init__(self, csr: CSRGraph, num_labelings: int = 2):
+        self.csr = csr
+        self.dag, self.component = condensation(csr)
+        count = self.dag.num_vertices
+        self.labels: List[tuple] = []
+        self.tree_pre: Optional[array] = None
+        self.tree_post: Optional[array] = None
+        for labeling in range(num_labelings):
+            # Alternate the child order so the labelings cut different pairs
+            low, post, pre = self._interval_labels(count, reverse=labeling % 2 == 1)
+            self.labels.append((low, post))
+            if labeling == 0:
+                self.tree_pre, self.tree_post = pre, post
+
+    # Function to index a graph class from this repo or a plain adjacency list
+    # Time Complexity: O(K * (V + E))
+    # Space Complexity: O(K * V + E)
+    @classmethod
+    def from_graph(cls, graph: Any, num_labelings: int = 2) -> 'ReachabilityIndex':
+        """
+        Builds the index for graph_adjacency_list.Graph (adj_list), GraphNew.Graph (adjacency_list),
+        a Dict[Hashable, List[Hashable]] adjacency list or a CSRGraph.
+
+        Example Usage: index = ReachabilityIndex.from_graph(graph); index.reachable(1, 5)
+        """
+        if isinstance(graph, CSRGraph):
+            return cls(graph, num_labelings)
+        adjacency = getattr(graph, 'adj_list', None)
+        if adjacency is None:
+            adjacency = getattr(graph, 'adjacency_list', graph)
+        return cls(CSRGraph.from_adjacency_list(adjacency, weighted=False), num_labelings)
+
+    def _interval_labels(self, count: int, reverse: bool):
+        offsets, targets = self.dag.offsets, self.dag.targets
+        low = array('i', [0]) * count
+        post = array('i', [-1]) * count
+        pre = array('i', [0]) * count
+        pre_time = post_time = 0
+        roots = range(count - 1, -1, -1) if reverse else range(count)
+        for root in roots:
+            if post[root] != -1:
+                continue
+            pre[root] = pre_time
+            pre_time += 1
+            post[root] = -2
+            stack = [(root, self._children(root, reverse))]
+            while stack:
+                node, children = stack[-1]
+                child = next(children, None)
+                if child is None:
+                    stack.pop()
+                    post[node] = post_time
+                    lowest = post_time
+                    for i in range(offsets[node], offsets[node + 1]):
+                        lowest = min(lowest, low[targets[i]])
+                    low[node] = lowest
+                    post_time += 1
+                elif post[child] == -1:
+                    pre[child] = pre_time
+                    pre_time += 1
+                    post[child] = -2
+                    stack.append((child, self._children(child, reverse)))
+        return low, post, pre
+
+    def _children(self, node: int, reverse: bool):
+        children = self.dag.neighbors(node)
+        return iter(children[::-1] if reverse else children)
+
+    def _may_reach(self, a: int, b: int) -> bool:
+        # False means a certainly does not reach b; True means it might
+        if a > b:
+            return False
+        for low, post in self.labels:
+            if not (low[a] <= low[b] and post[b] <= post[a]):
+                return False
+        return True
+
+    def _tree_reaches(self, a: int, b: int) -> bool:
+        return self.tree_pre[a] <= self.tree_pre[b] and self.tree_post[b] <= self.tree_post[a]
+
+    # Function to answer one reachability query
+    # Time Complexity: O(K) when a filter decides, otherwise a pruned search of the condensation
+    # Space Complexity: O(1), O(C) for a search where C is the number of components visited
+    def reachable(self, source: Hashable, target: Hashable) -> bool:
+        """
+        Returns True when there is a directed path from source to target (every node reaches itself).
+
+        Trick: Filters first; the fallback DFS only enters components that pass the same filters for target.
+        """
+        a = self.component[self.csr.vertex_id(source)]
+        b = self.component[self.csr.vertex_id(target)]
+        if a == b:
+            return True
+        if not self._may_reach(a, b):
+            return False
+        if self._tree_reaches(a, b):
+            return True
+
+        offsets, targets = self.dag.offsets, self.dag.targets
+        seen = {a}
+        stack = [a]
+        while stack:
+            node = stack.pop()
+            for i in range(offsets[node], offsets[node + 1]):
+                child = targets[i]
+                if child == b or (child not in seen and self._tree_reaches(child, b)):
+                    return True
+                if child not in seen and self._may_reach(child, b):
+                    seen.add(child)
+                    stack.append(child)
+        return False
+
+
+# Example usage:
+if __name__ == "__main__":
+    from graph_adjacency_list import Graph
+
+    graph = Graph()
+    for vertex in range(1, 7):
+        graph.insert_vertex(vertex)
+    for source, destination in [(1, 2), (2, 3), (3, 1), (3, 4), (4, 5), (6, 5)]:
+        graph.insert_edge(source, destination)
+
+    index = ReachabilityIndex.from_graph(graph)
+    print("1 -> 5:", index.reachable(1, 5))  # Expected output: True
+    print("3 -> 2:", index.reachable(3, 2))  # Expected output: True
+    print("5 -> 1:", index.reachable(5, 1))  # Expected output: False
+    print("6 -> 1:", index.reachable(6, 1))  # Expected output: False